@@ -11,11 +11,13 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Optional, Dict
 import logging
+import os
 from pathlib import Path
 import asyncio
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (LOG_LEVEL from environment, INFO when unset or unknown)
+_log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), None)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import utilities
@@ -28,13 +30,21 @@ except ImportError:
     from utils import *
     from scheduler import health_scheduler
 
+# Serialize responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # FastAPI app
 app = FastAPI(
     title="Metabolical Backend API",
     description="Health articles API with search, categorization, and pagination",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultResponse
 )
 
 # Startup and shutdown event handlers
@@ -110,6 +120,9 @@ class ArticleSchema(BaseModel):
     author: Optional[str] = None
 
 class PaginatedArticleResponse(BaseModel):
+    # For cursor requests `page` echoes the page parameter, `total` and
+    # `total_pages` cover the whole filtered set and `has_previous` is
+    # always true; keep following next_cursor instead of page numbers
     articles: List[ArticleSchema]
     total: int
     page: int
@@ -117,6 +130,7 @@ class PaginatedArticleResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 class HealthResponse(BaseModel):
     status: str
@@ -124,6 +138,15 @@ class HealthResponse(BaseModel):
     database_status: str
     total_articles: Optional[int] = None
 
+def check_page_cursor(cursor: Optional[str]):
+    """Reject a malformed pagination cursor with 400 before any query runs"""
+    if cursor is None:
+        return
+    try:
+        decode_page_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
 # =============================================
 # BASE API ENDPOINTS (NO PREFIX)
 # =============================================
@@ -132,12 +155,15 @@ class HealthResponse(BaseModel):
 def search_articles_base(
     q: str = Query(..., description="Search query", min_length=2),
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order"),
     start_date: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)")
 ):
     """Search articles - Base endpoint without prefix"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"🔍 Base Search: '{q}', page: {page}, limit: {limit}")
         
@@ -147,7 +173,8 @@ def search_articles_base(
             limit=limit,
             sort_by=sort_by,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         logger.info(f"📊 Base Search '{q}' result: {result['total']} total, {len(result['articles'])} returned")
@@ -161,10 +188,13 @@ def search_articles_base(
 def get_articles_by_category_base(
     category: str,
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order")
 ):
     """Get articles by category - Base endpoint without prefix"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"📂 Base Category request: '{category}', page: {page}, limit: {limit}")
         
@@ -172,7 +202,8 @@ def get_articles_by_category_base(
             page=page,
             limit=limit,
             sort_by=sort_by,
-            category=category
+            category=category,
+            cursor=cursor
         )
         
         logger.info(f"📊 Base Category '{category}' result: {result['total']} total articles, {len(result['articles'])} returned")
@@ -186,10 +217,13 @@ def get_articles_by_category_base(
 def get_articles_by_tag_base(
     tag: str,
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order")
 ):
     """Get articles by tag - Base endpoint without prefix"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"🏷️ Base Tag request: '{tag}', page: {page}, limit: {limit}")
         
@@ -197,7 +231,8 @@ def get_articles_by_tag_base(
             page=page,
             limit=limit,
             sort_by=sort_by,
-            tag=tag
+            tag=tag,
+            cursor=cursor
         )
         
         logger.info(f"📊 Base Tag '{tag}' result: {result['total']} total articles, {len(result['articles'])} returned")
@@ -239,12 +274,15 @@ def api_v1_root():
 def search_articles_v1_articles(
     q: str = Query(..., description="Search query", min_length=2),
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order"),
     start_date: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)")
 ):
     """Search articles - V1 articles endpoint"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"🔍 V1 Articles Search: '{q}', page: {page}, limit: {limit}")
         
@@ -254,7 +292,8 @@ def search_articles_v1_articles(
             limit=limit,
             sort_by=sort_by,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         logger.info(f"📊 V1 Articles Search '{q}' result: {result['total']} total, {len(result['articles'])} returned")
@@ -268,12 +307,15 @@ def search_articles_v1_articles(
 def search_articles_v1(
     q: str = Query(..., description="Search query", min_length=2),
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order"),
     start_date: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)")
 ):
     """Search articles - V1 endpoint"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"🔍 V1 Search: '{q}', page: {page}, limit: {limit}")
         
@@ -283,7 +325,8 @@ def search_articles_v1(
             limit=limit,
             sort_by=sort_by,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            cursor=cursor
         )
         
         logger.info(f"📊 V1 Search '{q}' result: {result['total']} total, {len(result['articles'])} returned")
@@ -297,10 +340,13 @@ def search_articles_v1(
 def get_articles_by_category_v1(
     category: str,
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order")
 ):
     """Get articles by category - V1 endpoint"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"📂 V1 Category request: '{category}', page: {page}, limit: {limit}")
         
@@ -308,7 +354,8 @@ def get_articles_by_category_v1(
             page=page,
             limit=limit,
             sort_by=sort_by,
-            category=category
+            category=category,
+            cursor=cursor
         )
         
         logger.info(f"📊 V1 Category '{category}' result: {result['total']} total articles, {len(result['articles'])} returned")
@@ -322,10 +369,13 @@ def get_articles_by_category_v1(
 def get_articles_by_tag_v1(
     tag: str,
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over page"),
     limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
     sort_by: str = Query("desc", enum=["asc", "desc"], description="Sort order")
 ):
     """Get articles by tag - V1 endpoint"""
+    check_page_cursor(cursor)
+    
     try:
         logger.info(f"🏷️ V1 Tag request: '{tag}', page: {page}, limit: {limit}")
         
@@ -333,7 +383,8 @@ def get_articles_by_tag_v1(
             page=page,
             limit=limit,
             sort_by=sort_by,
-            tag=tag
+            tag=tag,
+            cursor=cursor
         )
         
         logger.info(f"📊 V1 Tag '{tag}' result: {result['total']} total articles, {len(result['articles'])} returned")
@@ -390,23 +441,18 @@ def get_scheduler_status():
     try:
         jobs = health_scheduler.get_scheduled_jobs()
         
-        # Get database stats for monitoring
-        import sqlite3
-        from pathlib import Path
-        
-        db_path = Path(__file__).parent.parent / "data" / "articles.db"
-        with sqlite3.connect(db_path) as conn:
+        # Get database stats for monitoring from a pooled read connection
+        with connection_pool.get_reader() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM articles")
-            total_articles = cursor.fetchone()[0]
-            
-            # Get articles from last 24 hours
-            cursor.execute("SELECT COUNT(*) FROM articles WHERE created_at >= datetime('now', '-1 day')")
-            recent_articles = cursor.fetchone()[0]
-            
-            # Get latest article date
-            cursor.execute("SELECT MAX(date) FROM articles")
-            latest_article_date = cursor.fetchone()[0]
+            # Total, last-24-hour count and latest article date in one round
+            # trip; each subquery is answered from its own index
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM articles),
+                    (SELECT COUNT(*) FROM articles WHERE created_at >= datetime('now', '-1 day')),
+                    (SELECT MAX(date) FROM articles)
+            """)
+            total_articles, recent_articles, latest_article_date = cursor.fetchone()
         
         return {
             "status": "running" if health_scheduler.is_running else "stopped",
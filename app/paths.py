@@ -0,0 +1,30 @@
+"""
+Filesystem locations shared by the API, scheduler, scrapers and scripts.
+
+Kept free of third-party imports so any entry point can use it cheaply.
+"""
+
+import os
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+def resolve_db_path() -> Path:
+    """
+    Locate the articles database
+
+    METABOLIC_DB wins when set. Otherwise data/articles.db is used, unless
+    only the legacy db/articles.db exists.
+    """
+    override = os.getenv("METABOLIC_DB")
+    if override:
+        return Path(override)
+
+    db_path = BASE_DIR / "data" / "articles.db"
+    legacy_path = BASE_DIR / "db" / "articles.db"
+    if not db_path.exists() and legacy_path.exists():
+        return legacy_path
+    return db_path
+
+# Database path - resolved once at import
+DB_PATH = resolve_db_path()
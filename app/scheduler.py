@@ -62,7 +62,9 @@ class HealthNewsScheduler:
             try:
                 from app.scrapers.master_health_scraper import MasterHealthScraper
                 scraper = MasterHealthScraper()
-                result = scraper.run_scraping()
+                # Scraping is blocking network and SQLite work; run it on a
+                # worker thread so the API's event loop keeps serving requests
+                result = await asyncio.get_running_loop().run_in_executor(None, scraper.run_scraping)
                 
                 logger.info(f"✅ Scheduled scraping completed: {result['total_saved']} articles saved")
                 
@@ -79,7 +81,7 @@ class HealthNewsScheduler:
                     # Use the compatible scraper as fallback
                     from app.scrapers.simple_compatible_scraper import SimpleHealthScraper
                     scraper = SimpleHealthScraper()
-                    result = scraper.run_scraping()
+                    result = await asyncio.get_running_loop().run_in_executor(None, scraper.run_scraping)
                     logger.info(f"✅ Fallback scraping completed: {result.get('saved', 0)} articles saved")
                     return result
                 else:
@@ -97,40 +99,62 @@ class HealthNewsScheduler:
         try:
             logger.info("🧹 Starting database cleanup...")
             
-            import sqlite3
-            db_path = BASE_DIR / "data" / "articles.db"
+            # The shared writer lock and VACUUM both block; keep them off the event loop
+            deleted_count = await asyncio.get_running_loop().run_in_executor(None, self._cleanup_database_sync)
             
-            with sqlite3.connect(db_path) as conn:
-                # Delete articles older than 6 months
-                six_months_ago = (datetime.now() - timedelta(days=180)).isoformat()
-                
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM articles WHERE created_at < ?", (six_months_ago,))
-                deleted_count = cursor.rowcount
-                
-                # Vacuum database to reclaim space
-                conn.execute("VACUUM")
-                
-                logger.info(f"✅ Database cleanup completed: {deleted_count} old articles removed")
-                
-                if self.is_cloud:
-                    logger.info(f"📊 Cloud DB Cleanup - Removed: {deleted_count} articles older than 6 months")
+            logger.info(f"✅ Database cleanup completed: {deleted_count} old articles removed")
+            
+            if self.is_cloud:
+                logger.info(f"📊 Cloud DB Cleanup - Removed: {deleted_count} articles older than 6 months")
                     
         except Exception as e:
             logger.error(f"❌ Database cleanup failed: {e}")
             if not self.is_cloud:
                 raise
 
+    def _cleanup_database_sync(self) -> int:
+        """Delete articles older than 6 months, then compact the database"""
+        import sqlite3
+        from contextlib import closing
+        
+        try:
+            from .utils import connection_pool
+        except ImportError:
+            from utils import connection_pool
+        
+        six_months_ago = (datetime.now() - timedelta(days=180)).isoformat()
+        
+        # Go through the API's WAL writer so the delete queues behind
+        # request writes instead of failing on a second writer's lock
+        with connection_pool.get_writer() as conn:
+            deleted_count = conn.execute(
+                "DELETE FROM articles WHERE created_at < ?", (six_months_ago,)
+            ).rowcount
+        
+        # VACUUM can't run inside the writer's transaction, so it gets a
+        # short-lived connection of its own to the same file
+        with closing(sqlite3.connect(connection_pool.database, timeout=30.0)) as conn:
+            # Vacuum database to reclaim space
+            conn.execute("VACUUM")
+            
+            # Refresh planner statistics for tables that changed since
+            # the last run; the API only does this at shutdown otherwise
+            conn.execute("PRAGMA optimize")
+        
+        return deleted_count
+
     async def keepalive_task(self):
         """Keepalive task to prevent cloud service from sleeping"""
         try:
             logger.info("💓 Keepalive heartbeat - Scheduler active")
             
-            # Simple database query to keep connection alive
-            import sqlite3
-            db_path = BASE_DIR / "data" / "articles.db"
+            # Simple database query to keep the pooled connections alive
+            try:
+                from .utils import connection_pool
+            except ImportError:
+                from utils import connection_pool
             
-            with sqlite3.connect(db_path) as conn:
+            with connection_pool.get_reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM articles")
                 count = cursor.fetchone()[0]
@@ -22,6 +22,9 @@ import json
 import re
 import time
 import logging
+import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse, quote_plus
@@ -51,25 +54,68 @@ except ImportError:
     class URLValidator:
         def validate_article_url(self, article):
             return True, {"status": "valid"}
+        
+        def validate_articles_batch(self, articles):
+            return [self.validate_article_url(article) for article in articles]
+        
+        def close(self):
+            pass
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database path
-DB_PATH = BASE_DIR / "data" / "articles.db"
+# Database path, resolved in one place for every entry point
+from app.paths import DB_PATH
+
+# Feeds fetched at once; each RSS source is a different host
+FEED_WORKERS = 6
+
+# Seconds each feed worker waits before taking its next source
+FEED_DELAY = 2
+
+# Databases created before url was UNIQUE don't ignore repeats, so
+# already-stored URLs are skipped before any trigger runs
+INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles 
+    (title, summary, url, date, source, categories, tags, url_health, authors)
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9
+    WHERE NOT EXISTS (SELECT 1 FROM articles WHERE url = ?3)
+"""
+
+# HTML tags stripped from titles and descriptions by _clean_html
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Health-related tag mapping, built once rather than on every article
+TAG_KEYWORDS = {
+    'diabetes': ('diabetes', 'blood sugar', 'insulin', 'glucose'),
+    'nutrition': ('nutrition', 'diet', 'food', 'eating', 'vitamin'),
+    'fitness': ('fitness', 'exercise', 'workout', 'physical activity'),
+    'mental_health': ('mental health', 'depression', 'anxiety', 'stress'),
+    'heart_health': ('heart', 'cardiovascular', 'blood pressure', 'cholesterol'),
+    'weight_management': ('weight', 'obesity', 'overweight', 'BMI'),
+    'preventive_care': ('prevention', 'screening', 'early detection'),
+    'lifestyle': ('lifestyle', 'wellness', 'healthy living'),
+    'women_health': ('women', 'pregnancy', 'maternal'),
+    'men_health': ('men', 'prostate', 'testosterone'),
+    'elderly': ('elderly', 'aging', 'senior')
+}
 
 class MasterHealthScraper:
     """Unified health news scraper combining all sources"""
     
     def __init__(self):
         self.url_validator = URLValidator()
-        self.session = requests.Session()
-        self.session.headers.update({
+        # URLs already stored; refreshed by run_scraping, skipped by validation
+        self.known_urls = frozenset()
+        # Feeds are fetched from several threads and requests.Session isn't
+        # documented as thread-safe, so each thread keeps its own (see `session`)
+        self._local = threading.local()
+        self.request_headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-        })
+        }
         
         # Health keywords for searches
         self.health_keywords = [
@@ -105,6 +151,16 @@ class MasterHealthScraper:
             {"name": "Medscape News", "url": "https://www.medscape.com/rss/allnews", "category": "medical_research"},
         ]
 
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's HTTP session, created on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.request_headers)
+            self._local.session = session
+        return session
+
     def init_database(self):
         """Initialize the database with required tables"""
         with sqlite3.connect(DB_PATH) as conn:
@@ -145,10 +201,13 @@ class MasterHealthScraper:
                     if not feed.entries:
                         raise Exception("No entries found")
                         
+                    parsed = []
                     for entry in feed.entries[:20]:  # Limit to 20 articles per source
                         article = self._parse_rss_entry(entry, source)
                         if article:
-                            articles.append(article)
+                            parsed.append(article)
+                    
+                    articles.extend(self._drop_invalid_urls(parsed))
                             
                 except Exception as e:
                     logger.warning(f"Feedparser failed for {source['name']}: {e}, trying manual parsing")
@@ -174,6 +233,12 @@ class MasterHealthScraper:
             
         return articles
 
+    def _scrape_source_then_pause(self, source: Dict) -> List[Dict]:
+        """Scrape one source, then hold this worker for FEED_DELAY seconds"""
+        articles = self.scrape_rss_source(source)
+        time.sleep(FEED_DELAY)  # Rate limiting
+        return articles
+
     def _parse_rss_entry(self, entry, source: Dict) -> Optional[Dict]:
         """Parse individual RSS entry"""
         try:
@@ -205,21 +270,44 @@ class MasterHealthScraper:
                 'read_time': max(3, len(description.split()) // 200)  # Estimate read time
             }
             
-            # Validate URL more strictly
-            is_valid, validation_info = self.url_validator.validate_article_url(article)
-            if not is_valid:
-                logger.warning(f"Skipping article with invalid URL: {url} - {validation_info.get('error', 'Unknown error')}")
-                return None
-                
+            # URLs are validated per feed by _drop_invalid_urls
             return article
             
         except Exception as e:
             logger.error(f"Error parsing entry: {e}")
             return None
 
+    def _load_known_urls(self) -> frozenset:
+        """URLs already in the database, read once per scraping run"""
+        try:
+            with closing(sqlite3.connect(DB_PATH)) as conn:
+                return frozenset(url for (url,) in conn.execute("SELECT url FROM articles"))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load stored URLs, validating every article: {e}")
+            return frozenset()
+
+    def _drop_invalid_urls(self, articles: List[Dict], log=logger.warning, label: str = "article") -> List[Dict]:
+        """Validate a feed's article URLs in one concurrent batch, keeping the valid ones"""
+        # Stored URLs are never inserted again, so they skip the network check
+        to_check = [article for article in articles if article['url'] not in self.known_urls]
+        results = dict(zip(
+            (article['url'] for article in to_check),
+            self.url_validator.validate_articles_batch(to_check)
+        ))
+        
+        valid = []
+        for article in articles:
+            is_valid, validation_info = results.get(article['url'], (True, None))
+            if is_valid:
+                valid.append(article)
+            else:
+                log(f"Skipping {label} with invalid URL: {article['url']} - {validation_info.get('error', 'Unknown error')}")
+        return valid
+
     def _manual_rss_parse(self, source: Dict) -> List[Dict]:
         """Manual RSS parsing for sources where feedparser fails - Enhanced"""
         articles = []
+        candidates = []
         try:
             # Add timeout and better headers
             headers = {
@@ -281,12 +369,10 @@ class MasterHealthScraper:
                             'read_time': max(3, len(description.split()) // 200)
                         }
                         
-                        # Validate URL before adding
-                        is_valid, validation_info = self.url_validator.validate_article_url(article)
-                        if is_valid:
-                            articles.append(article)
-                        else:
-                            logger.debug(f"Skipping article with invalid URL in manual parse: {url} - {validation_info.get('error', 'Unknown error')}")
+                        candidates.append(article)
+            
+            # Validate URLs before adding
+            articles = self._drop_invalid_urls(candidates, log=logger.debug, label="article in manual parse")
         
         except Exception as e:
             # Don't log as error - this is already a fallback method
@@ -308,6 +394,7 @@ class MasterHealthScraper:
                 url = f"https://news.google.com/rss/search?q={quote_plus(keyword)}&hl=en-US&gl=US&ceid=US:en"
                 
                 feed = feedparser.parse(url)
+                parsed = []
                 for entry in feed.entries[:5]:  # 5 articles per keyword
                     article = self._parse_rss_entry(entry, {
                         'name': 'Google News',
@@ -316,13 +403,9 @@ class MasterHealthScraper:
                     
                     if article:
                         article['tags'] = f"{article['tags']},{keyword}" if article['tags'] else keyword
-                        
-                        # Double-check URL validation for Google News articles
-                        is_valid, validation_info = self.url_validator.validate_article_url(article)
-                        if is_valid:
-                            articles.append(article)
-                        else:
-                            logger.warning(f"Skipping Google News article with invalid URL: {article.get('url')} - {validation_info.get('error', 'Unknown error')}")
+                        parsed.append(article)
+                
+                articles.extend(self._drop_invalid_urls(parsed, label="Google News article"))
                 
                 time.sleep(1)  # Rate limiting
                 
@@ -359,7 +442,7 @@ class MasterHealthScraper:
             return ""
         
         # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', text)
+        clean = HTML_TAG_RE.sub('', text)
         # Replace HTML entities
         clean = clean.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
         clean = clean.replace('&quot;', '"').replace('&#39;', "'").replace('&nbsp;', ' ')
@@ -391,78 +474,90 @@ class MasterHealthScraper:
         
         text = f"{title} {description}".lower()
         
-        # Health-related tag mapping
-        tag_keywords = {
-            'diabetes': ['diabetes', 'blood sugar', 'insulin', 'glucose'],
-            'nutrition': ['nutrition', 'diet', 'food', 'eating', 'vitamin'],
-            'fitness': ['fitness', 'exercise', 'workout', 'physical activity'],
-            'mental_health': ['mental health', 'depression', 'anxiety', 'stress'],
-            'heart_health': ['heart', 'cardiovascular', 'blood pressure', 'cholesterol'],
-            'weight_management': ['weight', 'obesity', 'overweight', 'BMI'],
-            'preventive_care': ['prevention', 'screening', 'early detection'],
-            'lifestyle': ['lifestyle', 'wellness', 'healthy living'],
-            'women_health': ['women', 'pregnancy', 'maternal'],
-            'men_health': ['men', 'prostate', 'testosterone'],
-            'elderly': ['elderly', 'aging', 'senior']
-        }
-        
-        for tag, keywords in tag_keywords.items():
+        for tag, keywords in TAG_KEYWORDS.items():
             if any(keyword in text for keyword in keywords):
                 tags.append(tag)
         
         return ','.join(list(set(tags)))  # Remove duplicates
 
     def save_articles(self, articles: List[Dict]) -> int:
-        """Save articles to database"""
-        saved_count = 0
+        """Save articles to database in a single batched transaction"""
+        rows = []
+        for article in articles:
+            try:
+                rows.append((
+                    article['title'],
+                    article['summary'],  # Changed from 'description' to 'summary'
+                    article['url'],
+                    article['published_date'],  # Maps to 'date' column
+                    article['source'],
+                    article['category'],  # Maps to 'categories' column
+                    article['tags'],
+                    article.get('image_url', ''),  # Maps to 'url_health' column for images
+                    article.get('author', '')  # Maps to 'authors' column
+                ))
+            except Exception as e:
+                logger.error(f"Skipping malformed article '{article.get('title')}': {e}")
         
-        with sqlite3.connect(DB_PATH) as conn:
-            for article in articles:
+        if not rows:
+            return 0
+        
+        try:
+            with closing(sqlite3.connect(DB_PATH)) as conn:
+                # WAL + NORMAL syncs once per checkpoint instead of per commit
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
                 try:
-                    conn.execute("""
-                        INSERT OR IGNORE INTO articles 
-                        (title, summary, url, date, source, categories, tags, url_health, authors)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        article['title'],
-                        article['summary'],  # Changed from 'description' to 'summary'
-                        article['url'],
-                        article['published_date'],  # Maps to 'date' column
-                        article['source'],
-                        article['category'],  # Maps to 'categories' column
-                        article['tags'],
-                        article.get('image_url', ''),  # Maps to 'url_health' column for images
-                        article.get('author', '')  # Maps to 'authors' column
-                    ))
-                    
-                    if conn.total_changes > 0:
-                        saved_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error saving article '{article['title']}': {e}")
-            
-            conn.commit()
+                    with conn:
+                        # Rows skipped as duplicates don't count; trigger writes are excluded
+                        saved_count = conn.executemany(INSERT_ARTICLE_SQL, rows).rowcount
+                except sqlite3.Error as e:
+                    logger.warning(f"Batch insert of {len(rows)} articles failed ({e}), saving them one by one")
+                    saved_count = self._save_rows_individually(conn, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving {len(rows)} articles: {e}")
+            return 0
         
         return saved_count
 
+    def _save_rows_individually(self, conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        """Insert rows in one transaction, each under its own savepoint so a bad row only loses itself"""
+        saved_count = 0
+        with conn:
+            conn.execute("BEGIN")
+            for row in rows:
+                conn.execute("SAVEPOINT article")
+                try:
+                    saved_count += conn.execute(INSERT_ARTICLE_SQL, row).rowcount
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO article")
+                    logger.error(f"Error saving article '{row[0]}': {e}")
+                conn.execute("RELEASE article")
+        return saved_count
+
     def run_scraping(self) -> Dict:
         """Run complete scraping process"""
         logger.info("🚀 Starting Master Health Scraper...")
         
         # Initialize database
         self.init_database()
+        self.known_urls = self._load_known_urls()
         
         all_articles = []
         
-        # Scrape RSS sources
-        for source in self.rss_sources:
-            articles = self.scrape_rss_source(source)
-            all_articles.extend(articles)
-            time.sleep(2)  # Rate limiting
-        
-        # Scrape Google News
-        google_articles = self.scrape_google_news()
-        all_articles.extend(google_articles)
+        # Every RSS source is fetched once from its own host, so feeds run
+        # concurrently; Google News is one more task and keeps its own
+        # per-query rate limiting. URL checks from all feeds share the
+        # validator's bounded pool.
+        try:
+            with ThreadPoolExecutor(max_workers=FEED_WORKERS) as executor:
+                google_future = executor.submit(self.scrape_google_news)
+                for articles in executor.map(self._scrape_source_then_pause, self.rss_sources):
+                    all_articles.extend(articles)
+                all_articles.extend(google_future.result())
+        finally:
+            self.url_validator.close()
         
         # Save to database
         saved_count = self.save_articles(all_articles)
@@ -10,6 +10,7 @@ import requests
 import sqlite3
 import json
 import logging
+from contextlib import closing
 from datetime import datetime
 from typing import List, Dict
 from bs4 import BeautifulSoup
@@ -23,8 +24,19 @@ sys.path.append(str(BASE_DIR))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database path
-DB_PATH = BASE_DIR / "data" / "articles.db"
+# Database path, resolved in one place for every entry point
+from app.paths import DB_PATH
+
+# Databases created before url was UNIQUE don't ignore repeats, so
+# already-stored URLs are skipped before any trigger runs
+INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO articles 
+    (date, title, authors, summary, url, categories, tags, source, 
+     priority, url_accessible, last_checked, subcategory, 
+     news_score, trending_score, content_quality_score)
+    SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13, ?14, ?15
+    WHERE NOT EXISTS (SELECT 1 FROM articles WHERE url = ?5)
+"""
 
 class SimpleHealthScraper:
     """Simple health news scraper compatible with Python 3.13"""
@@ -98,6 +110,11 @@ class SimpleHealthScraper:
             if not items:
                 items = root.findall('.//{http://www.w3.org/2005/Atom}entry')  # Atom format
             
+            # Values shared by every item of this feed, computed once
+            checked_at = datetime.now().isoformat()
+            categories = json.dumps([source_info['category']])
+            tags = json.dumps(['health', 'news'])
+            
             for item in items[:10]:  # Limit to 10 articles per source
                 try:
                     # Extract basic fields
@@ -112,7 +129,7 @@ class SimpleHealthScraper:
                     title = self.clean_text(title_elem.text or "")
                     url = link_elem.text or link_elem.get('href', '')
                     description = self.clean_text(desc_elem.text or "") if desc_elem is not None else ""
-                    pub_date = date_elem.text if date_elem is not None else datetime.now().isoformat()
+                    pub_date = date_elem.text if date_elem is not None else checked_at
                     
                     if title and url:
                         article = {
@@ -121,13 +138,13 @@ class SimpleHealthScraper:
                             'url': url,
                             'date': self.parse_date(pub_date),
                             'source': source_info['name'],
-                            'categories': json.dumps([source_info['category']]),
-                            'tags': json.dumps(['health', 'news']),
+                            'categories': categories,
+                            'tags': tags,
                             'authors': '',
                             'subcategory': source_info['category'],
                             'priority': 1,
                             'url_accessible': 1,
-                            'last_checked': datetime.now().isoformat()
+                            'last_checked': checked_at
                         }
                         
                         articles.append(article)
@@ -186,48 +203,69 @@ class SimpleHealthScraper:
         return datetime.now().isoformat()
     
     def save_articles(self, articles: List[Dict]) -> int:
-        """Save articles to database"""
+        """Save articles to database in a single batched transaction"""
         if not articles:
             return 0
         
-        saved_count = 0
+        rows = []
+        for article in articles:
+            try:
+                rows.append((
+                    article['date'],
+                    article['title'],
+                    article['authors'],
+                    article['summary'],
+                    article['url'],
+                    article['categories'],
+                    article['tags'],
+                    article['source'],
+                    article['priority'],
+                    article['url_accessible'],
+                    article['last_checked'],
+                    article['subcategory'],
+                    0.7,  # news_score
+                    0.5,  # trending_score
+                    0.6   # content_quality_score
+                ))
+            except Exception as e:
+                logger.error(f"Skipping malformed article '{str(article.get('title'))[:50]}...': {e}")
         
-        with sqlite3.connect(DB_PATH) as conn:
-            for article in articles:
+        if not rows:
+            return 0
+        
+        try:
+            with closing(sqlite3.connect(DB_PATH)) as conn:
+                # WAL + NORMAL syncs once per checkpoint instead of per commit
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
                 try:
-                    conn.execute("""
-                        INSERT OR IGNORE INTO articles 
-                        (date, title, authors, summary, url, categories, tags, source, 
-                         priority, url_accessible, last_checked, subcategory, 
-                         news_score, trending_score, content_quality_score)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        article['date'],
-                        article['title'],
-                        article['authors'],
-                        article['summary'],
-                        article['url'],
-                        article['categories'],
-                        article['tags'],
-                        article['source'],
-                        article['priority'],
-                        article['url_accessible'],
-                        article['last_checked'],
-                        article['subcategory'],
-                        0.7,  # news_score
-                        0.5,  # trending_score
-                        0.6   # content_quality_score
-                    ))
-                    
-                    if conn.total_changes > 0:
-                        saved_count += 1
-                        logger.info(f"✅ Saved: {article['title'][:60]}...")
-                        
-                except Exception as e:
-                    logger.error(f"Error saving article '{article['title'][:50]}...': {e}")
-            
-            conn.commit()
+                    with conn:
+                        # Rows skipped as duplicates don't count; trigger writes are excluded
+                        saved_count = conn.executemany(INSERT_ARTICLE_SQL, rows).rowcount
+                except sqlite3.Error as e:
+                    logger.warning(f"Batch insert of {len(rows)} articles failed ({e}), saving them one by one")
+                    saved_count = self._save_rows_individually(conn, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Error saving {len(rows)} articles: {e}")
+            return 0
         
+        logger.info(f"✅ Saved {saved_count} new articles ({len(rows) - saved_count} already stored or failed)")
+        return saved_count
+    
+    def _save_rows_individually(self, conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        """Insert rows in one transaction, each under its own savepoint so a bad row only loses itself"""
+        saved_count = 0
+        with conn:
+            conn.execute("BEGIN")
+            for row in rows:
+                conn.execute("SAVEPOINT article")
+                try:
+                    saved_count += conn.execute(INSERT_ARTICLE_SQL, row).rowcount
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO article")
+                    logger.error(f"Error saving article '{str(row[1])[:50]}...': {e}")
+                conn.execute("RELEASE article")
         return saved_count
     
     def run_scraping(self) -> Dict:
@@ -3,28 +3,60 @@ Metabolical Backend Utilities - Simplified and Clean
 Database operations and utility functions for the health articles API.
 """
 
+import atexit
+import base64
+import os
+import queue
+import sys
 import sqlite3
 import json
 import threading
+import heapq
+import time
 import re
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
-from functools import lru_cache
+from functools import lru_cache, wraps
 from contextlib import contextmanager
 import logging
 import yaml
 from pathlib import Path
+from types import MappingProxyType
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# orjson is a much faster drop-in for decoding and encoding; fall back to
+# stdlib json (compact separators, matching orjson's output)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(value) -> str:
+        return json.dumps(value, separators=(',', ':'))
 
-# Database path - adjusted for new structure
-DB_PATH = str(Path(__file__).parent.parent / "data" / "articles.db")
+# ciso8601 parses ISO-8601 in C; datetime.fromisoformat is the fallback
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
 
-# Fallback to old path if new doesn't exist
-if not Path(DB_PATH).exists():
-    DB_PATH = str(Path(__file__).parent.parent / "db" / "articles.db")
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+logger = logging.getLogger(__name__)
+
+# Database path, resolved in one place for every entry point (see paths.py)
+try:
+    from .paths import DB_PATH as _DB_PATH
+except ImportError:
+    from paths import DB_PATH as _DB_PATH
+DB_PATH = str(_DB_PATH)
 
 # Category keywords file path - updated to use new unified config
 CATEGORY_YAML_PATH = Path(__file__).parent / "health_categories.yml"
@@ -237,35 +269,54 @@ def get_enhanced_tag_conditions(tag: str) -> Tuple[str, List[str]]:
     Enhanced tag matching using keywords, content analysis, and semantic matching
     Returns SQL WHERE condition and parameters for better categorization
     """
+    condition, params = _build_tag_conditions(tag, _fts_enabled)
+    return condition, list(params)
+
+@lru_cache(maxsize=256)
+def _build_tag_conditions(tag: str, fts_enabled: bool) -> Tuple[str, Tuple[str, ...]]:
+    """Memoized body of get_enhanced_tag_conditions, keyed on whether FTS is in use"""
     
     # Get keywords for the requested tag
     keywords = ENHANCED_KEYWORDS.get(tag.lower(), [])
     
     # Basic tag matching (existing logic)
     tag_underscore = tag.replace(" ", "_")
+    tag_keywords = [keyword.lower() for keyword in keywords[:8]]  # Limit to top 8 keywords for performance
+    content_keywords = tag_keywords[:4]  # Top 4 keywords for content matching
     conditions = []
     params = []
     
-    # 1. Exact tag matching (existing logic)
-    conditions.append('(LOWER(tags) LIKE LOWER(?) OR LOWER(tags) LIKE LOWER(?))')
-    params.extend([f'%"{tag}"%', f'%"{tag_underscore}"%'])
+    # 1. Exact tag matching through the article_tags index
+    conditions.append('id IN (SELECT article_id FROM article_tags WHERE tag COLLATE NOCASE IN (?, ?, ?))')
+    params.extend([tag, tag_underscore, tag.replace("_", " ")])
     
-    # 2. Enhanced keyword matching if available
-    if keywords:
-        # Keyword matching in tags
+    # 2. Enhanced keyword matching if available; the trigram index only
+    # matches substrings of 3+ characters
+    if keywords and fts_enabled and all(len(keyword) >= 3 for keyword in tag_keywords):
+        match_expr = "{tags} : (" + " OR ".join(
+            _fts_phrase_query(keyword) for keyword in tag_keywords
+        ) + ") OR {title summary} : (" + " OR ".join(
+            _fts_phrase_query(keyword) for keyword in content_keywords
+        ) + ")"
+        conditions.append('id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)')
+        params.append(match_expr)
+    elif keywords:
+        # Keyword matching in tags. LIKE already folds ASCII case (as does
+        # LOWER()), and the keywords are lowercased above, so the columns
+        # are compared as stored instead of lowering every row
         keyword_conditions = []
-        for keyword in keywords[:8]:  # Limit to top 8 keywords for performance
-            keyword_conditions.append('LOWER(tags) LIKE LOWER(?)')
-            params.append(f'%{keyword.lower()}%')
+        for keyword in tag_keywords:
+            keyword_conditions.append('tags LIKE ?')
+            params.append(f'%{keyword}%')
         
         if keyword_conditions:
             conditions.append(f'({" OR ".join(keyword_conditions)})')
         
         # Content-based matching (title and summary) for top keywords
         content_conditions = []
-        for keyword in keywords[:4]:  # Top 4 keywords for content matching
-            content_conditions.append('(LOWER(title) LIKE LOWER(?) OR LOWER(summary) LIKE LOWER(?))')
-            params.extend([f'%{keyword.lower()}%', f'%{keyword.lower()}%'])
+        for keyword in content_keywords:
+            content_conditions.append('(title LIKE ? OR summary LIKE ?)')
+            params.extend([f'%{keyword}%', f'%{keyword}%'])
         
         if content_conditions:
             conditions.append(f'({" OR ".join(content_conditions)})')
@@ -273,80 +324,280 @@ def get_enhanced_tag_conditions(tag: str) -> Tuple[str, List[str]]:
     # Combine all conditions with OR logic
     final_condition = f'({" OR ".join(conditions)})'
     
-    return final_condition, params
+    return final_condition, tuple(params)
+
+# JSON1 helpers - json_each/json_extract raise on malformed JSON, and some
+# scrapers store plain strings, so always guard with json_valid()
+_JSON_ARRAY_SQL = "CASE WHEN json_valid({0}) THEN CASE json_type({0}) WHEN 'array' THEN {0} ELSE '[]' END ELSE '[]' END"
+# Category values are either a JSON array or a plain string; dispatch on the
+# first character so plain strings never reach the JSON parser
+_FIRST_CATEGORY_SQL = (
+    "CASE WHEN substr(categories, 1, 1) != '[' THEN categories "
+    "WHEN json_valid(categories) THEN json_extract(categories, '$[0]') "
+    "ELSE categories END"
+)
+# Categories as a JSON array, wrapping plain (non-JSON) values as a single category
+_CATEGORY_ARRAY_SQL = (
+    "CASE WHEN substr({0}, 1, 1) != '[' THEN json_array({0}) "
+    "WHEN json_valid({0}) THEN {0} "
+    "ELSE json_array({0}) END"
+)
+
+@lru_cache(maxsize=4096)
+def _parse_json_cached(raw: str):
+    """Decode a JSON column value once per distinct string.
+    
+    Lists are returned as tuples so the shared cached value can't be mutated.
+    """
+    value = _json_loads(raw)
+    return tuple(value) if isinstance(value, list) else value
+
+def _parse_tag_array(raw: str) -> Tuple:
+    """
+    Decode a JSON array of tags, returning () for anything else
+    
+    Plain comma-separated tag strings are rejected on the first character
+    without going through the JSON parser.
+    """
+    if not raw.startswith('['):
+        return ()
+    try:
+        tags = _parse_json_cached(raw)
+    except ValueError:
+        return ()
+    return tags if isinstance(tags, tuple) else ()
+
+@lru_cache(maxsize=4096)
+def _clean_tag(tag: str) -> str:
+    """Convert underscores to spaces, sharing one interned string per distinct tag"""
+    return sys.intern(tag.replace("_", " "))
+
+@lru_cache(maxsize=8192)
+def _parse_display_tags(raw: str) -> Tuple:
+    """Decode and clean a raw tags value, cached so repeats are a single lookup"""
+    return tuple(_clean_tag(tag) if isinstance(tag, str) else tag for tag in _parse_tag_array(raw))
+
+@lru_cache(maxsize=4096)
+def _parse_article_date(value: str) -> datetime:
+    """Parse an ISO-8601 date string, accepting a trailing 'Z' for UTC (memoized; datetimes are immutable)"""
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return _parse_iso_datetime(value)
+
+# Column list shared by the article queries; rows are read as plain tuples
+# and unpacked by _article_from_row. The stored categories value trails the
+# article fields for _postprocess_article's source and tag fallbacks.
+_ARTICLE_COLUMNS_SQL = (
+    "id, title, summary, NULL as content, url, source, date, "
+    f"{_FIRST_CATEGORY_SQL} as category, NULL as subcategory, tags, "
+    "NULL as image_url, authors as author, categories as raw_categories"
+)
+_RAW_CATEGORIES_INDEX = 12
+
+def _article_from_row(row: Tuple) -> Dict:
+    """Build an article dict from a tuple row selected with _ARTICLE_COLUMNS_SQL (extra trailing columns are ignored)"""
+    (article_id, title, summary, content, url, source, date,
+     category, subcategory, tags, image_url, author, *_) = row
+    return {
+        'id': article_id,
+        'title': title,
+        'summary': summary,
+        'content': content,
+        'url': url,
+        'source': source,
+        'date': date,
+        'category': category,
+        'subcategory': subcategory,
+        'tags': tags,
+        'image_url': image_url,
+        'author': author
+    }
+
+CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+]
 
-# Simple connection pool
+# Persistent connection pools
 class SQLiteConnectionPool:
-    def __init__(self, database: str):
+    """
+    Long-lived SQLite connections split into one writer and N readers
+    
+    WAL mode lets any number of readers run alongside a single writer, so
+    read-only connections are pooled (opened lazily, up to `pool_size`)
+    while all writes are serialised through one dedicated connection.
+    """
+    
+    def __init__(self, database: str, pool_size: int = 8):
         self.database = database
+        self.pool_size = pool_size
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._connections = []
         self._lock = threading.Lock()
-        
-    @contextmanager
-    def get_connection(self):
-        conn = sqlite3.connect(self.database, timeout=30.0, check_same_thread=False)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=10000")
+        self._writer = None
+        self._writer_lock = threading.Lock()
+    
+    def _create_connection(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            uri = Path(self.database).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=30.0, check_same_thread=False,
+                                   cached_statements=256)
+            conn.execute("PRAGMA query_only=1")
+        else:
+            conn = sqlite3.connect(self.database, timeout=30.0, check_same_thread=False,
+                                   cached_statements=256)
+            # WAL lets readers run alongside writes; the mode is stored in
+            # the database file so setting it on the writer is enough
+            conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        return conn
+    
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if len(self._connections) < self.pool_size:
+                conn = self._create_connection(read_only=True)
+                self._connections.append(conn)
+                return conn
         
+        # Pool is at capacity - wait for a connection to be returned
+        return self._pool.get(timeout=30.0)
+        
+    @contextmanager
+    def get_reader(self):
+        """Borrow a read-only connection from the reader pool"""
+        conn = self._acquire()
         try:
             yield conn
         finally:
-            conn.close()
+            # Never hand a connection with an open transaction to the next caller
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+    
+    @contextmanager
+    def get_writer(self):
+        """
+        Hold the single writer connection inside a BEGIN IMMEDIATE transaction
+        
+        The transaction is committed on success and rolled back on error.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._create_connection(read_only=False)
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            else:
+                if conn.in_transaction:
+                    conn.commit()
+    
+    def close_all(self):
+        """Close every connection opened by the pool"""
+        with self._writer_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                    self._writer.close()
+                except sqlite3.Error:
+                    pass
+                self._writer = None
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._pool = queue.Queue(maxsize=self.pool_size)
+
+# Global connection pool; reads are I/O-light so allow two readers per core
+connection_pool = SQLiteConnectionPool(
+    DB_PATH,
+    pool_size=int(os.getenv("DB_CONNECTION_POOL_SIZE", str((os.cpu_count() or 4) * 2)))
+)
+atexit.register(connection_pool.close_all)
 
-# Global connection pool
-connection_pool = SQLiteConnectionPool(DB_PATH)
+# Substrings that mark an article URL as unusable
+INVALID_URL_PATTERNS = frozenset([
+    'example.com', 'example.org', 'example.net',
+    'domain.com', 'test.com', 'localhost',
+    'javascript:', 'mailto:', 'file:', 'ftp:',
+    '404', 'not-found', 'error',
+    'google.com/rss/articles/',
+    'dummy.com', 'sample.com'
+])
 
-def is_valid_article_url(url: str) -> bool:
+# Article URL validity, stored in articles.url_valid so pages can be
+# filtered (and counted) without validating rows in Python: an http(s) URL
+# with a host and none of INVALID_URL_PATTERNS
+_VALID_URL_SQL = (
+    "CASE WHEN {0} IS NULL THEN 0 "
+    "WHEN lower({0}) NOT LIKE 'http://%' AND lower({0}) NOT LIKE 'https://%' THEN 0 "
+    "WHEN " + " OR ".join(f"instr(lower({{0}}), '{p}') > 0" for p in sorted(INVALID_URL_PATTERNS)) + " THEN 0 "
+    # Empty netloc, e.g. "https:///path"
+    "WHEN substr({0}, instr({0}, '://') + 3, 1) IN ('', '/', '?', '#') THEN 0 "
+    "ELSE 1 END"
+)
+
+# Cache for category keywords (read-only view once loaded)
+_category_cache: Mapping = MappingProxyType({})
+
+# Statistics are cached for 5 minutes
+STATS_CACHE_TTL = 300
+
+def _ttl_cache(ttl: float):
     """
-    Check if an article URL is valid and accessible
+    Cache the result of a zero-argument function for `ttl` seconds
     
-    Args:
-        url: The URL to validate
-        
-    Returns:
-        bool: True if URL is valid, False otherwise
+    Each decorated function keeps its own expiry (monotonic clock).
+    Exceptions are not cached. Use `func.cache_clear()` to invalidate.
     """
-    if not url or url == '' or url == 'NULL':
-        return False
-    
-    # Check for problematic URL patterns
-    invalid_url_patterns = [
-        'example.com', 'example.org', 'example.net',
-        'domain.com', 'test.com', 'localhost',
-        'javascript:', 'mailto:', 'file:', 'ftp:',
-        '404', 'not-found', 'error',
-        'google.com/rss/articles/',
-        'dummy.com', 'sample.com'
-    ]
-    
-    url_lower = url.lower()
-    for pattern in invalid_url_patterns:
-        if pattern in url_lower:
-            return False
-    
-    # Check if URL has proper format
-    try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return False
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'value': None, 'expires': 0.0}
         
-        # Must be HTTP or HTTPS
-        if parsed.scheme not in ['http', 'https']:
-            return False
-            
-    except Exception:
-        return False
-    
-    return True
+        @wraps(func)
+        def wrapper():
+            with lock:
+                if time.monotonic() < state['expires']:
+                    return state['value']
+                value = func()
+                state['value'] = value
+                state['expires'] = time.monotonic() + ttl
+                return value
+        
+        def cache_clear():
+            with lock:
+                state['value'] = None
+                state['expires'] = 0.0
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
 
-# Cache for category keywords
-_category_cache = {}
-_stats_cache = {}
-_cache_timestamp = None
+def _deep_freeze(value):
+    """Return a read-only view of parsed YAML: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _deep_freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(item) for item in value)
+    return value
 
-def get_cached_category_keywords() -> Dict:
+def get_cached_category_keywords() -> Mapping:
     """Load and cache category keywords from YAML file"""
     global _category_cache
     
@@ -354,30 +605,32 @@ def get_cached_category_keywords() -> Dict:
         return _category_cache
         
     try:
-        if CATEGORY_YAML_PATH.exists():
-            with open(CATEGORY_YAML_PATH, 'r', encoding='utf-8') as file:
-                _category_cache = yaml.safe_load(file) or {}
-                logger.info(f"Loaded {len(_category_cache)} categories from {CATEGORY_YAML_PATH}")
-        else:
-            logger.warning(f"Category file not found: {CATEGORY_YAML_PATH}")
-            _category_cache = {
-                "diseases": {"diabetes": [], "obesity": [], "cardiovascular": []},
-                "news": {"recent_developments": [], "policy_and_regulation": []},
-                "solutions": {"medical_treatments": [], "preventive_care": []},
-                "food": {"nutrition_basics": [], "superfoods": []},
-                "audience": {"women": [], "men": [], "children": []},
-                "blogs_and_opinions": {"expert_opinions": [], "patient_stories": []}
-            }
+        with open(CATEGORY_YAML_PATH, 'r', encoding='utf-8') as file:
+            loaded = yaml.load(file, Loader=_YamlSafeLoader) or {}
+            logger.info(f"Loaded {len(loaded)} categories from {CATEGORY_YAML_PATH}")
+    except FileNotFoundError:
+        logger.warning(f"Category file not found: {CATEGORY_YAML_PATH}")
+        loaded = {
+            "diseases": {"diabetes": [], "obesity": [], "cardiovascular": []},
+            "news": {"recent_developments": [], "policy_and_regulation": []},
+            "solutions": {"medical_treatments": [], "preventive_care": []},
+            "food": {"nutrition_basics": [], "superfoods": []},
+            "audience": {"women": [], "men": [], "children": []},
+            "blogs_and_opinions": {"expert_opinions": [], "patient_stories": []}
+        }
     except Exception as e:
         logger.error(f"Error loading categories: {e}")
-        _category_cache = {}
-        
+        loaded = {}
+    
+    # Freeze (nested values included) so request handlers can share it
+    # without locking or copying
+    _category_cache = _deep_freeze(loaded)
     return _category_cache
 
 def get_total_articles_count() -> int:
     """Get total number of articles in database"""
     try:
-        with connection_pool.get_connection() as conn:
+        with connection_pool.get_reader() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM articles")
             return cursor.fetchone()[0]
@@ -385,6 +638,243 @@ def get_total_articles_count() -> int:
         logger.error(f"Error getting article count: {e}")
         return 0
 
+# Fallback summary topics, tried in priority order against the article title.
+# Each alternative is a lookahead so the first *listed* topic wins, not the
+# first one to appear in the title.
+_SUMMARY_DISPATCH = re.compile(
+    r'(?P<diabetes>(?=.*diabetes))'
+    r'|(?P<heart>(?=.*(?:heart|cardiovascular)))'
+    r'|(?P<nutrition>(?=.*(?:nutrition|diet)))'
+    r'|(?P<mental>(?=.*mental health))'
+    r'|(?P<covid>(?=.*(?:covid|pandemic)))'
+    r'|(?P<research>(?=.*(?:research|study)))',
+    re.IGNORECASE | re.DOTALL
+)
+
+_SUMMARY_TEMPLATES = {
+    'diabetes': "Latest insights on diabetes management and treatment options from {source}.",
+    'heart': "Important developments in heart health and cardiovascular care from {source}.",
+    'nutrition': "New findings on nutrition and dietary recommendations from {source}.",
+    'mental': "Mental health insights and wellness strategies from {source}.",
+    'covid': "COVID-19 updates and public health information from {source}.",
+    'research': "New medical research findings and healthcare study results from {source}.",
+}
+
+# Fallback tags keyed on title words: (words, tags added when any word matches).
+# Condition rules come first, then research and news type rules. Kept apart
+# from the summary topics above, whose word lists are narrower.
+_TITLE_TAG_RULES = (
+    (('diabetes', 'diabetic'), ('diabetes', 'blood sugar', 'endocrinology')),
+    (('heart', 'cardiac', 'cardiovascular'), ('heart health', 'cardiovascular', 'cardiology')),
+    (('mental health', 'depression', 'anxiety'), ('mental health', 'wellness', 'psychology')),
+    (('nutrition', 'diet', 'food'), ('nutrition', 'diet', 'healthy eating')),
+    (('cancer', 'tumor', 'oncology'), ('cancer', 'oncology', 'treatment')),
+    (('covid', 'coronavirus', 'pandemic'), ('covid-19', 'pandemic', 'public health')),
+    (('vaccine', 'vaccination', 'immunization'), ('vaccination', 'immunization', 'prevention')),
+    (('study', 'research', 'trial'), ('medical research',)),
+    (('breakthrough', 'discovery'), ('breakthrough research',)),
+    (('treatment', 'therapy'), ('treatment',)),
+    (('prevention', 'preventive'), ('prevention',)),
+)
+
+# Openings of summaries generated by an earlier pass, never regenerated
+_GENERATED_SUMMARY_PREFIXES = (
+    'Important health news:',
+    'Latest insights on',
+    'New medical research findings',
+    'COVID-19 updates and public health',
+    'Mental health insights',
+)
+
+def _needs_fallback_text(summary_lower: str) -> bool:
+    """Whether a lowercased summary is a generic placeholder"""
+    return (
+        summary_lower in ('recent developments', 'health news', 'breaking news') or
+        'health article summary' in summary_lower
+    )
+
+# Generic tag phrases rewritten in a single pass over the raw tags string
+_TAG_REPLACEMENTS = {
+    'recent developments': 'health updates',
+    'general': 'health news',
+}
+_TAG_FIX_RE = re.compile('|'.join(re.escape(phrase) for phrase in _TAG_REPLACEMENTS))
+
+# Source references like "Source: XYZ." or "(From: XYZ)" stripped from summaries
+_SOURCE_RE = re.compile(r'\((?:Source|From):.*?\)|(?:Source|From):.*?(?:\.|$)')
+_RECENT_DEVELOPMENTS_RE = re.compile(r'recent developments?\.?', re.IGNORECASE)
+_BREAKING_NEWS_RE = re.compile(r'breaking news\.?', re.IGNORECASE)
+
+def _postprocess_article(article: Dict, raw_categories=None) -> Dict:
+    """
+    Clean a raw article row for the API response
+    
+    Fills in defaults, fallback summaries and tags, and parses tags/date.
+    Rows are expected to have passed the url_valid filter already.
+    `raw_categories` is the stored categories value, which the source and
+    tag fallbacks read rather than the projected first category.
+    """
+    # Clean data - handle None/NULL values for required and optional fields
+    # Ensure required fields have proper defaults if None
+    if article.get('source') is None or article.get('source') == '':
+        # Set a default source based on category if possible
+        if raw_categories:
+            if isinstance(raw_categories, str) and raw_categories.lower() in ["news", "diseases", "solutions", "food"]:
+                article['source'] = f"{raw_categories.capitalize()} Information"
+            else:
+                article['source'] = "Health Information Source"
+        else:
+            article['source'] = "Health Information Source"
+    
+    if article.get('title') is None or article.get('title') == '':
+        article['title'] = 'Untitled'  # Required field
+    
+    # Clean optional fields - convert empty strings to None
+    for optional_field in ['content', 'category', 'subcategory', 'image_url', 'author']:
+        if article.get(optional_field) == '' or article.get(optional_field) == 'NULL':
+            article[optional_field] = None
+    
+    # Special handling for summary - ensure it's never empty and meaningful
+    summary = (article.get('summary') or '').strip()
+    
+    # Check if summary is empty, too short, or generic
+    # Don't process summaries that are already generated fallbacks
+    is_generated_fallback = (
+        summary and (
+            summary.startswith(_GENERATED_SUMMARY_PREFIXES) or
+            'Stay informed with the latest from' in summary
+        )
+    )
+    
+    # Cheap emptiness/length checks first; the summary is lowered only once
+    # and only when those don't already decide it
+    needs_fallback = not is_generated_fallback and (  # Don't regenerate already generated summaries
+        not summary or 
+        summary == 'NULL' or 
+        len(summary) < 10 or  # Reduced from 20 to 10 - less aggressive
+        _needs_fallback_text(summary.lower())
+    )
+    
+    if needs_fallback:
+        # Generate a more meaningful fallback summary based on title and category
+        title = article.get('title', 'Health Article')
+        category = article.get('category', 'health')
+        source = article.get('source', 'Health News')
+        
+        # Create a more descriptive summary
+        topic = _SUMMARY_DISPATCH.match(title)
+        if topic:
+            article['summary'] = _SUMMARY_TEMPLATES[topic.lastgroup].format(source=source)
+        else:
+            # Generic but more informative fallback
+            if len(title) > 80:
+                article['summary'] = f"{title[:77]}... - Read more about this health development from {source}."
+            else:
+                article['summary'] = f"Important health news: {title}. Stay informed with the latest from {source}."
+        
+        logger.debug("Generated enhanced fallback summary for article %s: %.50s...", article.get('id'), article['summary'])
+    else:
+        # Clean and enhance existing summary
+        if summary:
+            # Remove source references like "Source: XYZ" or "(Source: XYZ)" from the summary
+            summary = _SOURCE_RE.sub('', summary)
+            
+            # Clean up generic phrases
+            summary = _RECENT_DEVELOPMENTS_RE.sub('new updates', summary)
+            summary = _BREAKING_NEWS_RE.sub('latest information', summary)
+            
+            # Ensure proper sentence ending
+            summary = summary.strip()
+            if summary and not summary.endswith(('.', '!', '?', '...')):
+                summary += '.'
+            
+            article['summary'] = summary
+    
+    # Ensure tags is always a meaningful list
+    tags = article.get('tags', '')
+    if not tags or tags in ['', 'NULL', None] or tags.lower() in ['recent developments', 'general']:
+        # Generate meaningful tags based on title and content
+        title = article.get('title', '').lower()
+        category = raw_categories.lower() if isinstance(raw_categories, str) else ''
+        source = article.get('source', '').lower()
+        
+        generated_tags = []
+        
+        for words, rule_tags in _TITLE_TAG_RULES:
+            if any(word in title for word in words):
+                generated_tags.extend(rule_tags)
+        
+        # Source-based tags
+        if 'who' in source:
+            generated_tags.append('global health')
+        if 'cdc' in source or 'nih' in source:
+            generated_tags.append('public health')
+        
+        # Category-based fallback
+        if not generated_tags:
+            if 'health' in category:
+                generated_tags = ['health news', 'wellness']
+            elif 'medical' in category:
+                generated_tags = ['medical news', 'healthcare']
+            else:
+                generated_tags = ['health', 'news']
+        
+        # Convert to string format that the database expects
+        article['tags'] = ', '.join(list(set(generated_tags)))
+    elif isinstance(tags, str):
+        # Clean existing tags
+        article['tags'] = _TAG_FIX_RE.sub(lambda m: _TAG_REPLACEMENTS[m.group()], tags)
+    else:
+        article['tags'] = []
+    
+    # Parse tags if they're stored as JSON string
+    if article.get('tags'):
+        if isinstance(article['tags'], str):
+            # Convert underscores back to spaces for frontend compatibility
+            article['tags'] = list(_parse_display_tags(article['tags']))
+    else:
+        article['tags'] = []
+        
+    # Parse date
+    if article.get('date'):
+        try:
+            article['date'] = _parse_article_date(article['date'])
+        except (ValueError, AttributeError, TypeError):
+            article['date'] = datetime.now()
+    
+    return article
+
+# Year bucket that leads the descending sort order (current year first)
+_DATE_BUCKET_SQL = """CASE 
+                        WHEN date LIKE '%2025%' THEN 1 
+                        WHEN date LIKE '%2024%' THEN 2 
+                        ELSE 3 
+                    END"""
+
+def _date_bucket(date: Optional[str]) -> int:
+    """Python mirror of _DATE_BUCKET_SQL for building seek cursors"""
+    if date and '2025' in date:
+        return 1
+    if date and '2024' in date:
+        return 2
+    return 3
+
+def _encode_page_cursor(last_date: Optional[str], last_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    payload = _json_dumps({"last_date": last_date, "last_id": last_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_page_cursor(cursor: str) -> Tuple[Optional[str], int]:
+    """Decode a cursor from _encode_page_cursor, raising ValueError if malformed"""
+    try:
+        payload = _json_loads(base64.urlsafe_b64decode(cursor.encode()))
+        last_date, last_id = payload["last_date"], payload["last_id"]
+    except (TypeError, KeyError, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+    if not (last_date is None or isinstance(last_date, str)) or type(last_id) is not int:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    return last_date, last_id
+
 def get_articles_paginated_optimized(
     page: int = 1,
     limit: int = 20,
@@ -394,32 +884,60 @@ def get_articles_paginated_optimized(
     subcategory: Optional[str] = None,
     tag: Optional[str] = None,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> Dict:
     """
     Optimized paginated article retrieval with search and filtering
+    
+    Pass the "next_cursor" value of a previous result as `cursor` to seek
+    straight to the following page; without it `page` is translated to an
+    OFFSET for legacy callers. Cursor pages don't know their position:
+    "page" echoes the argument, "total"/"total_pages" describe the whole
+    filtered set and "has_previous" is always True. A malformed cursor
+    raises ValueError (see decode_page_cursor).
     """
+    # Decoded before the catch-all below, so a bad cursor isn't an empty page
+    seek_key = decode_page_cursor(cursor) if cursor else None
+    
     try:
-        with connection_pool.get_connection() as conn:
-            cursor = conn.cursor()
+        ensure_optimizations()
+        with connection_pool.get_reader() as conn:
+            db_cursor = conn.cursor()
+            db_cursor.row_factory = None  # plain tuples, unpacked by _article_from_row
             
-            # Build WHERE clause
-            where_conditions = []
-            params = []
+            # Build WHERE clause - cheap range predicates are evaluated first
+            # so fewer rows reach the LIKE/FTS filters
+            # Articles with broken URLs are excluded (see _VALID_URL_SQL)
+            cheap_conditions = ["url_valid = 1"]
+            cheap_params = []
+            expensive_conditions = []
+            expensive_params = []
             
-            if search_query:
-                # Search in title, summary, AND tags for better results
-                where_conditions.append("(title LIKE ? OR summary LIKE ? OR tags LIKE ?)")
-                search_term = f"%{search_query}%"
-                params.extend([search_term, search_term, search_term])
+            if start_date:
+                cheap_conditions.append("date >= ?")
+                cheap_params.append(start_date)
                 
+            if end_date:
+                cheap_conditions.append("date <= ?")
+                cheap_params.append(end_date)
+            
             if category:
-                # Since categories is stored as JSON array, we need to search within it
-                # Handle case-insensitive matching for better user experience
-                # Search for the category in both lowercase and capitalized forms
-                where_conditions.append("(LOWER(categories) LIKE LOWER(?) OR LOWER(categories) LIKE LOWER(?))")
-                params.extend([f'%"{category}"%', f'%"{category.capitalize()}"%'])
-                logger.info(f"🔍 Filtering by category: '{category}' (case-insensitive)")
+                # Case-insensitive category membership, seeked through the
+                # article_categories index (covers plain-string categories too)
+                cheap_conditions.append("id IN (SELECT article_id FROM article_categories WHERE category = ? COLLATE NOCASE)")
+                cheap_params.append(category)
+                logger.debug("🔍 Filtering by category: '%s' (case-insensitive)", category)
+            
+            if search_query:
+                # Search in title, summary, AND tags for better results
+                if _fts_enabled and len(search_query) >= 3:
+                    expensive_conditions.append("id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+                    expensive_params.append(_fts_phrase_query(search_query))
+                else:
+                    expensive_conditions.append("(title LIKE ? OR summary LIKE ? OR tags LIKE ?)")
+                    search_term = f"%{search_query}%"
+                    expensive_params.extend([search_term, search_term, search_term])
                 
             if tag:
                 # Use enhanced categorization system
@@ -427,282 +945,120 @@ def get_articles_paginated_optimized(
                 
                 # Special handling for "latest" - add date filter
                 if tag.lower() == "latest":
-                    # Combine enhanced matching with date filtering
-                    date_condition = """(
-                        date LIKE '%2025-08%' OR 
-                        date LIKE '%Aug 2025%' OR
-                        date LIKE '%2025%'
-                    )"""
-                    final_condition = f"({enhanced_condition} AND {date_condition})"
-                    where_conditions.append(final_condition)
-                    params.extend(enhanced_params)
-                    logger.info(f"🏷️ Enhanced filtering for LATEST tag with {len(enhanced_params)} conditions + date filter")
+                    # Check the date before the enhanced matching; '%2025%' also
+                    # covers the '2025-08' and 'Aug 2025' forms
+                    final_condition = f"(date LIKE '%2025%' AND {enhanced_condition})"
+                    expensive_conditions.append(final_condition)
+                    expensive_params.extend(enhanced_params)
+                    logger.debug("🏷️ Enhanced filtering for LATEST tag with %d conditions + date filter", len(enhanced_params))
                 else:
-                    where_conditions.append(enhanced_condition)
-                    params.extend(enhanced_params)
-                    logger.info(f"🏷️ Enhanced filtering for '{tag}' with {len(enhanced_params)} conditions (tags + keywords + content)")
+                    expensive_conditions.append(enhanced_condition)
+                    expensive_params.extend(enhanced_params)
+                    logger.debug("🏷️ Enhanced filtering for '%s' with %d conditions (tags + keywords + content)", tag, len(enhanced_params))
                 
             if subcategory:
                 # Use enhanced categorization for subcategory as well
                 enhanced_condition, enhanced_params = get_enhanced_tag_conditions(subcategory)
-                where_conditions.append(enhanced_condition)
-                params.extend(enhanced_params)
-                logger.info(f"🏷️ Enhanced filtering for subcategory '{subcategory}' with {len(enhanced_params)} conditions")
-                
-            if start_date:
-                where_conditions.append("date >= ?")
-                params.append(start_date)
-                
-            if end_date:
-                where_conditions.append("date <= ?")
-                params.append(end_date)
+                expensive_conditions.append(enhanced_condition)
+                expensive_params.extend(enhanced_params)
+                logger.debug("🏷️ Enhanced filtering for subcategory '%s' with %d conditions", subcategory, len(enhanced_params))
+            
+            where_conditions = cheap_conditions + expensive_conditions
+            params = cheap_params + expensive_params
             
             where_clause = ""
             if where_conditions:
                 where_clause = "WHERE " + " AND ".join(where_conditions)
             
+            descending = sort_by.upper() == "DESC"
+            
             # Order clause - simplified and reliable date sorting
-            if sort_by.upper() == "DESC":
+            if descending:
                 # For descending order, prioritize 2025 dates first with simpler logic
-                order_clause = """ORDER BY 
-                    CASE 
-                        WHEN date LIKE '%2025%' THEN 1 
-                        WHEN date LIKE '%2024%' THEN 2 
-                        ELSE 3 
-                    END ASC,
+                order_clause = f"""ORDER BY 
+                    {_DATE_BUCKET_SQL} ASC,
                     date DESC, 
                     id DESC"""
             else:
                 order_clause = f"ORDER BY date ASC, id ASC"
             
-            # Count total articles
-            count_query = f"SELECT COUNT(*) FROM articles {where_clause}"
-            logger.info(f"🔍 Count query: {count_query} with params: {params}")
-            cursor.execute(count_query, params)
-            total = cursor.fetchone()[0]
-            logger.info(f"📊 Found {total} articles matching criteria")
-            
-            # Calculate pagination
-            offset = (page - 1) * limit
-            total_pages = (total + limit - 1) // limit
-            
-            logger.info(f"📄 Pagination: page={page}, limit={limit}, offset={offset}, total={total}, total_pages={total_pages}")
+            if cursor:
+                # Seek past the last row of the previous page instead of
+                # scanning and discarding `offset` rows. NULL dates sort
+                # before every date, so they come last in descending order
+                # and first in ascending order; the row-value comparison
+                # can't see them, so they get explicit branches. Their id
+                # bound is written +id: SQLite 3.40 returns wrong rows when
+                # it is merged with an "id IN (...)" filter into one seek on
+                # idx_articles_valid_date_id.
+                last_date, last_id = seek_key
+                if descending and last_date is None:
+                    seek_condition = "(date IS NULL AND +id < ?)"
+                    seek_params = [last_id]
+                elif descending:
+                    seek_condition = (f"({_DATE_BUCKET_SQL} > ? OR "
+                                      f"({_DATE_BUCKET_SQL} = ? AND ((date, id) < (?, ?) OR date IS NULL)))")
+                    bucket = _date_bucket(last_date)
+                    seek_params = [bucket, bucket, last_date, last_id]
+                elif last_date is None:
+                    seek_condition = "(date IS NOT NULL OR +id > ?)"
+                    seek_params = [last_id]
+                else:
+                    seek_condition = "(date, id) > (?, ?)"
+                    seek_params = [last_date, last_id]
+                page_clause = ("AND " if where_clause else "WHERE ") + seek_condition
+                page_params = params + seek_params + [limit]
+                limit_clause = "LIMIT ?"
+                # The seek predicate narrows the window, so count separately
+                total_select = ""
+            else:
+                # Legacy page numbers map onto an OFFSET
+                offset = (page - 1) * limit
+                page_clause = ""
+                page_params = params + [limit, offset]
+                limit_clause = "LIMIT ? OFFSET ?"
+                # The window count sees the whole filtered set before LIMIT/OFFSET
+                total_select = ", COUNT(*) OVER () AS _total"
             
             # Get articles
             query = f"""
-                SELECT id, title, summary, NULL as content, url, source, date, categories as category, 
-                       NULL as subcategory, tags, NULL as image_url, authors as author 
+                SELECT {_ARTICLE_COLUMNS_SQL}{total_select}
                 FROM articles 
-                {where_clause} 
+                {where_clause} {page_clause}
                 {order_clause} 
-                LIMIT ? OFFSET ?
+                {limit_clause}
             """
             
-            cursor.execute(query, params + [limit, offset])
-            rows = cursor.fetchall()
+            # Convert to dictionaries straight off the cursor
+            articles = []
+            articles_append = articles.append
+            last_row = None
+            for last_row in db_cursor.execute(query, page_params):
+                articles_append(_postprocess_article(_article_from_row(last_row), last_row[_RAW_CATEGORIES_INDEX]))
             
-            # Log the IDs returned for debugging
-            returned_ids = [dict(row)['id'] for row in rows]
-            logger.info(f"📋 Returned article IDs: {returned_ids}")
+            if total_select and last_row is not None:
+                total = last_row[-1]
+            else:
+                # Cursor pages, and OFFSETs past the end, need an explicit count
+                count_query = f"SELECT COUNT(*) FROM articles {where_clause}"
+                logger.debug("🔍 Count query: %s with params: %s", count_query, params)
+                db_cursor.execute(count_query, params)
+                total = db_cursor.fetchone()[0]
+            logger.debug("📊 Found %d articles matching criteria", total)
             
-            # Convert to dictionaries
-            articles = []
-            for row in rows:
-                article = dict(row)
-                
-                # Clean data - handle None/NULL values for required and optional fields
-                # Ensure required fields have proper defaults if None
-                if article.get('source') is None or article.get('source') == '':
-                    # Set a default source based on category if possible
-                    if article.get('category'):
-                        if isinstance(article['category'], str) and article['category'].lower() in ["news", "diseases", "solutions", "food"]:
-                            article['source'] = f"{article['category'].capitalize()} Information"
-                        else:
-                            article['source'] = "Health Information Source"
-                    else:
-                        article['source'] = "Health Information Source"
-                
-                # Enhanced URL validation - exclude articles with broken URLs
-                url = article.get('url', '')
-                if not is_valid_article_url(url):
-                    logger.warning(f"Skipping article with invalid URL: {url} - Title: {article.get('title', 'Unknown')[:50]}")
-                    continue
-                
-                if article.get('title') is None or article.get('title') == '':
-                    article['title'] = 'Untitled'  # Required field
-                
-                # Clean optional fields - convert empty strings to None
-                for optional_field in ['content', 'category', 'subcategory', 'image_url', 'author']:
-                    if article.get(optional_field) == '' or article.get(optional_field) == 'NULL':
-                        article[optional_field] = None
-                
-                # Special handling for summary - ensure it's never empty and meaningful
-                summary = article.get('summary', '').strip()
-                
-                # Check if summary is empty, too short, or generic
-                # Don't process summaries that are already generated fallbacks
-                is_generated_fallback = (
-                    summary and (
-                        summary.startswith('Important health news:') or
-                        summary.startswith('Latest insights on') or
-                        summary.startswith('New medical research findings') or
-                        summary.startswith('COVID-19 updates and public health') or
-                        summary.startswith('Mental health insights') or
-                        'Stay informed with the latest from' in summary
-                    )
-                )
-                
-                needs_fallback = (
-                    not summary or 
-                    summary in ['', 'NULL', None] or 
-                    len(summary) < 10 or  # Reduced from 20 to 10 - less aggressive
-                    (summary.lower() in ['recent developments', 'health news', 'breaking news'] and not is_generated_fallback) or
-                    'health article summary' in summary.lower()
-                ) and not is_generated_fallback  # Don't regenerate already generated summaries
-                
-                if needs_fallback:
-                    # Generate a more meaningful fallback summary based on title and category
-                    title = article.get('title', 'Health Article')
-                    category = article.get('category', 'health')
-                    source = article.get('source', 'Health News')
-                    
-                    # Create a more descriptive summary
-                    if 'diabetes' in title.lower():
-                        article['summary'] = f"Latest insights on diabetes management and treatment options from {source}."
-                    elif 'heart' in title.lower() or 'cardiovascular' in title.lower():
-                        article['summary'] = f"Important developments in heart health and cardiovascular care from {source}."
-                    elif 'nutrition' in title.lower() or 'diet' in title.lower():
-                        article['summary'] = f"New findings on nutrition and dietary recommendations from {source}."
-                    elif 'mental health' in title.lower():
-                        article['summary'] = f"Mental health insights and wellness strategies from {source}."
-                    elif 'covid' in title.lower() or 'pandemic' in title.lower():
-                        article['summary'] = f"COVID-19 updates and public health information from {source}."
-                    elif 'research' in title.lower() or 'study' in title.lower():
-                        article['summary'] = f"New medical research findings and healthcare study results from {source}."
-                    else:
-                        # Generic but more informative fallback
-                        if len(title) > 80:
-                            article['summary'] = f"{title[:77]}... - Read more about this health development from {source}."
-                        else:
-                            article['summary'] = f"Important health news: {title}. Stay informed with the latest from {source}."
-                    
-                    logger.info(f"Generated enhanced fallback summary for article {article.get('id')}: {article['summary'][:50]}...")
-                else:
-                    # Clean and enhance existing summary
-                    if summary:
-                        import re
-                        # Remove source references like "Source: XYZ" or "(Source: XYZ)" from the summary
-                        summary = re.sub(r'\(Source:.*?\)', '', summary)
-                        summary = re.sub(r'Source:.*?(\.|$)', '', summary)
-                        summary = re.sub(r'\(From:.*?\)', '', summary)
-                        summary = re.sub(r'From:.*?(\.|$)', '', summary)
-                        
-                        # Clean up generic phrases
-                        summary = re.sub(r'recent developments?\.?', 'new updates', summary, flags=re.IGNORECASE)
-                        summary = re.sub(r'breaking news\.?', 'latest information', summary, flags=re.IGNORECASE)
-                        
-                        # Ensure proper sentence ending
-                        summary = summary.strip()
-                        if summary and not summary.endswith(('.', '!', '?', '...')):
-                            summary += '.'
-                        
-                        article['summary'] = summary
-                
-                # Ensure tags is always a meaningful list
-                tags = article.get('tags', '')
-                if not tags or tags in ['', 'NULL', None] or tags.lower() in ['recent developments', 'general']:
-                    # Generate meaningful tags based on title and content
-                    title = article.get('title', '').lower()
-                    category = article.get('category', '').lower()
-                    source = article.get('source', '').lower()
-                    
-                    generated_tags = []
-                    
-                    # Health condition tags
-                    if any(word in title for word in ['diabetes', 'diabetic']):
-                        generated_tags.extend(['diabetes', 'blood sugar', 'endocrinology'])
-                    if any(word in title for word in ['heart', 'cardiac', 'cardiovascular']):
-                        generated_tags.extend(['heart health', 'cardiovascular', 'cardiology'])
-                    if any(word in title for word in ['mental health', 'depression', 'anxiety']):
-                        generated_tags.extend(['mental health', 'wellness', 'psychology'])
-                    if any(word in title for word in ['nutrition', 'diet', 'food']):
-                        generated_tags.extend(['nutrition', 'diet', 'healthy eating'])
-                    if any(word in title for word in ['cancer', 'tumor', 'oncology']):
-                        generated_tags.extend(['cancer', 'oncology', 'treatment'])
-                    if any(word in title for word in ['covid', 'coronavirus', 'pandemic']):
-                        generated_tags.extend(['covid-19', 'pandemic', 'public health'])
-                    if any(word in title for word in ['vaccine', 'vaccination', 'immunization']):
-                        generated_tags.extend(['vaccination', 'immunization', 'prevention'])
-                    
-                    # Research and news type tags
-                    if any(word in title for word in ['study', 'research', 'trial']):
-                        generated_tags.append('medical research')
-                    if any(word in title for word in ['breakthrough', 'discovery']):
-                        generated_tags.append('breakthrough research')
-                    if any(word in title for word in ['treatment', 'therapy']):
-                        generated_tags.append('treatment')
-                    if any(word in title for word in ['prevention', 'preventive']):
-                        generated_tags.append('prevention')
-                    
-                    # Source-based tags
-                    if 'who' in source:
-                        generated_tags.append('global health')
-                    if 'cdc' in source or 'nih' in source:
-                        generated_tags.append('public health')
-                    
-                    # Category-based fallback
-                    if not generated_tags:
-                        if 'health' in category:
-                            generated_tags = ['health news', 'wellness']
-                        elif 'medical' in category:
-                            generated_tags = ['medical news', 'healthcare']
-                        else:
-                            generated_tags = ['health', 'news']
-                    
-                    # Convert to string format that the database expects
-                    article['tags'] = ', '.join(list(set(generated_tags)))
-                elif isinstance(tags, str):
-                    # Clean existing tags
-                    tags = tags.replace('recent developments', 'health updates')
-                    tags = tags.replace('general', 'health news')
-                    article['tags'] = tags
-                else:
-                    article['tags'] = []
-                
-                # Parse categories if they're stored as JSON string
-                if article.get('category'):
-                    try:
-                        if isinstance(article['category'], str):
-                            categories_list = json.loads(article['category'])
-                            # For backward compatibility, use the first category as 'category'
-                            if categories_list and len(categories_list) > 0:
-                                article['category'] = categories_list[0]
-                            else:
-                                article['category'] = None
-                    except (json.JSONDecodeError, TypeError):
-                        # If it's not JSON, keep as is
-                        pass
-                
-                # Parse tags if they're stored as JSON string
-                if article.get('tags'):
-                    try:
-                        if isinstance(article['tags'], str):
-                            article['tags'] = json.loads(article['tags'])
-                            # Convert underscores back to spaces for frontend compatibility
-                            article['tags'] = [tag.replace("_", " ") if isinstance(tag, str) else tag for tag in article['tags']]
-                    except (json.JSONDecodeError, TypeError):
-                        article['tags'] = []
-                else:
-                    article['tags'] = []
-                    
-                # Parse date
-                if article.get('date'):
-                    try:
-                        article['date'] = datetime.fromisoformat(article['date'].replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        article['date'] = datetime.now()
-                        
-                articles.append(article)
+            total_pages = (total + limit - 1) // limit
+            
+            logger.debug("📄 Pagination: page=%d, limit=%d, cursor=%s, total=%d, total_pages=%d",
+                         page, limit, cursor, total, total_pages)
+            
+            # Only a full page can have rows after it
+            next_cursor = None
+            if len(articles) == limit:
+                next_cursor = _encode_page_cursor(last_row[6], last_row[0])
+            
+            # Log the IDs returned for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 Returned article IDs: %s", [article['id'] for article in articles])
             
             return {
                 "articles": articles,
@@ -710,8 +1066,9 @@ def get_articles_paginated_optimized(
                 "page": page,
                 "limit": limit,
                 "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_previous": page > 1
+                "has_next": next_cursor is not None if cursor else page < total_pages,
+                "has_previous": page > 1 or bool(cursor),
+                "next_cursor": next_cursor
             }
             
     except Exception as e:
@@ -726,95 +1083,64 @@ def get_articles_paginated_optimized(
             "has_previous": False
         }
 
+@_ttl_cache(STATS_CACHE_TTL)
+def _load_category_stats() -> Dict[str, int]:
+    """Count articles per category"""
+    ensure_optimizations()
+    with connection_pool.get_reader() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT category, COUNT(*) as count
+            FROM article_categories
+            GROUP BY category
+            ORDER BY count DESC, category
+        """)
+        
+        return {row['category']: row['count'] for row in cursor}
+
 def get_category_stats_cached() -> Dict[str, int]:
     """Get cached category statistics"""
-    global _stats_cache, _cache_timestamp
-    
-    # Cache for 5 minutes
-    if _cache_timestamp and (datetime.now() - _cache_timestamp).seconds < 300:
-        return _stats_cache.get('categories', {})
-    
     try:
-        with connection_pool.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT categories, COUNT(*) as count 
-                FROM articles 
-                WHERE categories IS NOT NULL AND categories != '' 
-                GROUP BY categories
-            """)
-            
-            category_stats = {}
-            for row in cursor.fetchall():
-                categories_json = row['categories']
-                if categories_json:
-                    try:
-                        # Parse the JSON array of categories
-                        if isinstance(categories_json, str):
-                            categories_list = json.loads(categories_json)
-                        else:
-                            categories_list = categories_json
-                        
-                        # Count each category
-                        for category in categories_list:
-                            if category in category_stats:
-                                category_stats[category] += row['count']
-                            else:
-                                category_stats[category] = row['count']
-                    except (json.JSONDecodeError, TypeError):
-                        # If it's not JSON, treat as single category
-                        category_stats[categories_json] = row['count']
-                
-            _stats_cache['categories'] = category_stats
-            _cache_timestamp = datetime.now()
-            
-            return category_stats
-            
+        return _load_category_stats()
     except Exception as e:
         logger.error(f"Error getting category stats: {e}")
         return {}
 
-def get_cached_stats() -> Dict:
-    """Get cached general statistics"""
-    global _stats_cache, _cache_timestamp
+@_ttl_cache(STATS_CACHE_TTL)
+def _load_stats() -> Dict:
+    """Compute general article statistics"""
+    with connection_pool.get_reader() as conn:
+        cursor = conn.cursor()
+        
+        # Total articles, recent articles (last 7 days) and total sources
+        # in a single round trip. The recent count is a range scan on
+        # idx_articles_date; the GLOB keeps non-ISO dates (e.g. RFC 2822
+        # "Mon, 04 Aug 2025"), which sort after any ISO date, out of it.
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM articles),
+                (SELECT COUNT(*) FROM articles
+                 WHERE date > date('now', '-7 days') AND date GLOB '[0-9][0-9][0-9][0-9]-*'),
+                (SELECT COUNT(DISTINCT source) FROM articles)
+        """)
+        total_articles, recent_articles, total_sources = cursor.fetchone()
     
-    # Cache for 5 minutes
-    if _cache_timestamp and (datetime.now() - _cache_timestamp).seconds < 300:
-        return _stats_cache.get('general', {})
+    # Category stats
+    category_stats = get_category_stats_cached()
     
+    return {
+        "total_articles": total_articles,
+        "recent_articles_7_days": recent_articles,
+        "total_sources": total_sources,
+        "total_categories": len(category_stats),
+        "category_distribution": dict(list(category_stats.items())[:10]),
+        "last_updated": datetime.now().isoformat()
+    }
+
+def get_cached_stats() -> Dict:
+    """Get cached general statistics"""
     try:
-        with connection_pool.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Total articles
-            cursor.execute("SELECT COUNT(*) FROM articles")
-            total_articles = cursor.fetchone()[0]
-            
-            # Recent articles (last 7 days)
-            cursor.execute("SELECT COUNT(*) FROM articles WHERE date > date('now', '-7 days')")
-            recent_articles = cursor.fetchone()[0]
-            
-            # Total sources
-            cursor.execute("SELECT COUNT(DISTINCT source) FROM articles")
-            total_sources = cursor.fetchone()[0]
-            
-            # Category stats
-            category_stats = get_category_stats_cached()
-            
-            stats = {
-                "total_articles": total_articles,
-                "recent_articles_7_days": recent_articles,
-                "total_sources": total_sources,
-                "total_categories": len(category_stats),
-                "category_distribution": dict(list(category_stats.items())[:10]),
-                "last_updated": datetime.now().isoformat()
-            }
-            
-            _stats_cache['general'] = stats
-            _cache_timestamp = datetime.now()
-            
-            return stats
-            
+        return _load_stats()
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
         return {
@@ -826,64 +1152,53 @@ def get_cached_stats() -> Dict:
             "last_updated": datetime.now().isoformat()
         }
 
+# json_each's key is the array index, so rows come back in input order
+_ARTICLES_BY_IDS_SQL = f"""
+    WITH ids(article_id, pos) AS (SELECT value, key FROM json_each(?))
+    SELECT {_ARTICLE_COLUMNS_SQL}
+    FROM ids JOIN articles ON articles.id = ids.article_id
+    ORDER BY ids.pos
+"""
+
 def get_articles_by_ids(article_ids: List[int]) -> List[Dict]:
-    """Get multiple articles by their IDs"""
+    """Get multiple articles by their IDs, in the order the IDs were given"""
     if not article_ids:
         return []
         
     try:
-        with connection_pool.get_connection() as conn:
+        with connection_pool.get_reader() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples, unpacked by _article_from_row
             
-            # Create placeholders for IN clause
-            placeholders = ','.join(['?'] * len(article_ids))
-            query = f"""
-                SELECT id, title, summary, NULL as content, url, source, date, categories as category, 
-                       NULL as subcategory, tags, NULL as image_url, authors as author 
-                FROM articles 
-                WHERE id IN ({placeholders})
-                ORDER BY date DESC
-            """
-            
-            cursor.execute(query, article_ids)
-            rows = cursor.fetchall()
+            if len(article_ids) == 1:
+                # Single lookup - plain primary key equality
+                cursor.execute(f"SELECT {_ARTICLE_COLUMNS_SQL} FROM articles WHERE id = ?", (article_ids[0],))
+            else:
+                # Bind the whole ID list as one JSON array parameter so the
+                # SQL text is constant (reused from the statement cache) and
+                # not bounded by SQLite's variable limit
+                cursor.execute(_ARTICLES_BY_IDS_SQL, (_json_dumps(list(dict.fromkeys(article_ids))),))
             
             articles = []
-            for row in rows:
-                article = dict(row)
-                
-                # Parse categories if they're stored as JSON string
-                if article.get('category'):
-                    try:
-                        if isinstance(article['category'], str):
-                            categories_list = json.loads(article['category'])
-                            # For backward compatibility, use the first category as 'category'
-                            if categories_list and len(categories_list) > 0:
-                                article['category'] = categories_list[0]
-                            else:
-                                article['category'] = None
-                    except (json.JSONDecodeError, TypeError):
-                        # If it's not JSON, keep as is
-                        pass
+            articles_append = articles.append
+            for row in cursor:
+                article = _article_from_row(row)
                 
                 # Parse tags if they're stored as JSON string
                 if article.get('tags'):
-                    try:
-                        if isinstance(article['tags'], str):
-                            article['tags'] = json.loads(article['tags'])
-                    except (json.JSONDecodeError, TypeError):
-                        article['tags'] = []
+                    if isinstance(article['tags'], str):
+                        article['tags'] = list(_parse_tag_array(article['tags']))
                 else:
                     article['tags'] = []
                     
                 # Parse date
                 if article.get('date'):
                     try:
-                        article['date'] = datetime.fromisoformat(article['date'].replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
+                        article['date'] = _parse_article_date(article['date'])
+                    except (ValueError, AttributeError, TypeError):
                         article['date'] = datetime.now()
                         
-                articles.append(article)
+                articles_append(article)
             
             return articles
             
@@ -891,15 +1206,180 @@ def get_articles_by_ids(article_ids: List[int]) -> List[Dict]:
         logger.error(f"Error getting articles by IDs: {e}")
         return []
 
-def initialize_optimizations():
-    """Initialize database optimizations"""
+# Full-text index over title/summary/tags, kept in sync with triggers.
+# Set by initialize_optimizations(); search falls back to LIKE without FTS5.
+_fts_enabled = False
+
+FTS_SETUP_SQL = [
+    # Trigram tokens make MATCH a case-insensitive substring search, the
+    # same semantics as the LIKE '%...%' filters it replaces
+    """CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+       USING fts5(title, summary, tags, tokenize='trigram', content='articles', content_rowid='id')""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+           INSERT INTO articles_fts(rowid, title, summary, tags)
+           VALUES (new.id, new.title, new.summary, new.tags);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+           INSERT INTO articles_fts(articles_fts, rowid, title, summary, tags)
+           VALUES ('delete', old.id, old.title, old.summary, old.tags);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, summary, tags ON articles BEGIN
+           INSERT INTO articles_fts(articles_fts, rowid, title, summary, tags)
+           VALUES ('delete', old.id, old.title, old.summary, old.tags);
+           INSERT INTO articles_fts(rowid, title, summary, tags)
+           VALUES (new.id, new.title, new.summary, new.tags);
+       END""",
+]
+
+# Tags and categories of each article, kept in sync with the JSON columns
+# by triggers; non-JSON categories count as a single category. `row` is the
+# article row ("new" in triggers) and `source` the optional FROM table.
+_INSERT_ARTICLE_TAGS_SQL = (
+    "INSERT OR IGNORE INTO article_tags(article_id, tag) "
+    "SELECT {row}.id, j.value FROM {source}json_each(" + _JSON_ARRAY_SQL.format("{row}.tags") + ") j "
+    "WHERE j.type = 'text'"
+)
+_INSERT_ARTICLE_CATEGORIES_SQL = (
+    "INSERT OR IGNORE INTO article_categories(article_id, category) "
+    "SELECT {row}.id, j.value FROM {source}json_each(" + _CATEGORY_ARRAY_SQL.format("{row}.categories") + ") j "
+    "WHERE {row}.categories IS NOT NULL AND {row}.categories != '' AND j.value IS NOT NULL"
+)
+
+JOIN_TABLES_SETUP_SQL = [
+    """CREATE TABLE IF NOT EXISTS article_tags (
+           article_id INTEGER NOT NULL,
+           tag TEXT NOT NULL,
+           PRIMARY KEY (article_id, tag)
+       ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags(tag COLLATE NOCASE, article_id)",
+    # Display form (underscores as spaces) so get_all_tags is an ordered index scan
+    "CREATE INDEX IF NOT EXISTS idx_article_tags_display ON article_tags(REPLACE(tag, '_', ' '))",
+    """CREATE TABLE IF NOT EXISTS article_categories (
+           article_id INTEGER NOT NULL,
+           category TEXT NOT NULL,
+           PRIMARY KEY (article_id, category)
+       ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_article_categories_category ON article_categories(category, article_id)",
+    "CREATE INDEX IF NOT EXISTS idx_article_categories_category_nocase ON article_categories(category COLLATE NOCASE, article_id)",
+    f"""CREATE TRIGGER IF NOT EXISTS article_taxonomy_ai AFTER INSERT ON articles BEGIN
+           {_INSERT_ARTICLE_TAGS_SQL.format(row='new', source='')};
+           {_INSERT_ARTICLE_CATEGORIES_SQL.format(row='new', source='')};
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS article_taxonomy_ad AFTER DELETE ON articles BEGIN
+           DELETE FROM article_tags WHERE article_id = old.id;
+           DELETE FROM article_categories WHERE article_id = old.id;
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS article_tags_au AFTER UPDATE OF id, tags ON articles BEGIN
+           DELETE FROM article_tags WHERE article_id = old.id;
+           {_INSERT_ARTICLE_TAGS_SQL.format(row='new', source='')};
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS article_categories_au AFTER UPDATE OF id, categories ON articles BEGIN
+           DELETE FROM article_categories WHERE article_id = old.id;
+           {_INSERT_ARTICLE_CATEGORIES_SQL.format(row='new', source='')};
+       END""",
+]
+
+def _initialize_join_tables(cursor):
+    """Create the article_tags/article_categories tables, backfilling them on first run"""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'article_tags'")
+    exists = cursor.fetchone() is not None
+    
+    for sql in JOIN_TABLES_SETUP_SQL:
+        cursor.execute(sql)
+    
+    if not exists:
+        cursor.execute(_INSERT_ARTICLE_TAGS_SQL.format(row='articles', source='articles, '))
+        cursor.execute(_INSERT_ARTICLE_CATEGORIES_SQL.format(row='articles', source='articles, '))
+        logger.info("Built article tag and category tables")
+
+URL_VALIDITY_SETUP_SQL = [
+    f"""CREATE TRIGGER IF NOT EXISTS articles_url_valid_ai AFTER INSERT ON articles BEGIN
+           UPDATE articles SET url_valid = {_VALID_URL_SQL.format('new.url')} WHERE id = new.id;
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS articles_url_valid_au AFTER UPDATE OF url ON articles BEGIN
+           UPDATE articles SET url_valid = {_VALID_URL_SQL.format('new.url')} WHERE id = new.id;
+       END""",
+    # Partial index over the only rows the API serves; date-window counts
+    # and ascending pages are answered from the index alone
+    "CREATE INDEX IF NOT EXISTS idx_articles_valid_date_id ON articles(date, id) WHERE url_valid = 1",
+]
+
+def _initialize_url_validity(cursor):
+    """Add the url_valid column and its triggers, backfilling it on first run"""
+    cursor.execute("SELECT 1 FROM pragma_table_info('articles') WHERE name = 'url_valid'")
+    if cursor.fetchone() is None:
+        cursor.execute("ALTER TABLE articles ADD COLUMN url_valid INTEGER DEFAULT NULL")
+        cursor.execute(f"UPDATE articles SET url_valid = {_VALID_URL_SQL.format('url')}")
+        logger.info("Backfilled url_valid for %d articles", cursor.rowcount)
+    
+    for sql in URL_VALIDITY_SETUP_SQL:
+        cursor.execute(sql)
+
+def _fts_phrase_query(text: str) -> str:
+    """Quote text as a single FTS5 phrase (a substring match under the trigram tokenizer)"""
+    return '"' + text.replace('"', '""') + '"'
+
+def _initialize_fts(cursor) -> bool:
+    """Create the FTS5 index and sync triggers, building it on first run"""
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        logger.warning("SQLite %s has no trigram tokenizer, using LIKE search", sqlite3.sqlite_version)
+        return False
+    
+    cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'articles_fts'")
+    row = cursor.fetchone()
+    if row is not None and "trigram" not in row[0]:
+        # Index built with the default word tokenizer - recreate it
+        cursor.execute("DROP TABLE articles_fts")
+        row = None
+    
+    for sql in FTS_SETUP_SQL:
+        cursor.execute(sql)
+    
+    if row is None:
+        cursor.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        logger.info("Built full-text search index")
+    return True
+
+def _analyze_unindexed_stats(cursor):
+    """
+    ANALYZE tables that have indexes without planner statistics
+    
+    Covers a fresh database and indexes added since the last ANALYZE; the
+    writer refreshes existing statistics with PRAGMA optimize on close.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute("ANALYZE")
+        return
+    
+    cursor.execute("""
+        SELECT DISTINCT tbl_name FROM sqlite_master
+        WHERE type = 'index'
+          AND tbl_name IN ('articles', 'article_tags', 'article_categories')
+          AND name NOT IN (SELECT idx FROM sqlite_stat1 WHERE idx IS NOT NULL)
+    """)
+    for (table,) in cursor.fetchall():
+        cursor.execute(f'ANALYZE "{table}"')
+        logger.info("Analyzed %s for new index statistics", table)
+
+# Whether initialize_optimizations() has completed. Every listing query
+# needs url_valid and the join tables, so until then ensure_optimizations()
+# retries it - e.g. when the API starts before a scraper creates the table.
+_optimizations_ready = False
+_optimizations_retry_at = 0.0
+OPTIMIZATIONS_RETRY_SECONDS = 5.0
+
+def initialize_optimizations() -> bool:
+    """Initialize database optimizations, returning whether they were applied"""
+    global _fts_enabled, _optimizations_ready
     try:
-        with connection_pool.get_connection() as conn:
+        with connection_pool.get_writer() as conn:
             cursor = conn.cursor()
             
             # Create indexes if they don't exist
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date)",
+                "CREATE INDEX IF NOT EXISTS idx_articles_date_id ON articles(date DESC, id DESC)",
                 "CREATE INDEX IF NOT EXISTS idx_articles_categories ON articles(categories)",
                 "CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)",
                 "CREATE INDEX IF NOT EXISTS idx_articles_title ON articles(title)",
@@ -907,43 +1387,65 @@ def initialize_optimizations():
             
             for index_sql in indexes:
                 cursor.execute(index_sql)
+            
+            _initialize_join_tables(cursor)
+            _initialize_url_validity(cursor)
+            
+            try:
+                _fts_enabled = _initialize_fts(cursor)
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 - keep LIKE-based search
+                logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+                _fts_enabled = False
+            
+            _analyze_unindexed_stats(cursor)
                 
-            conn.commit()
             logger.info("Database indexes initialized successfully")
+        
+        _optimizations_ready = True
+        return True
             
     except Exception as e:
         logger.error(f"Error initializing optimizations: {e}")
+        return False
+
+def ensure_optimizations():
+    """Retry initialize_optimizations() until it succeeds, at most every OPTIMIZATIONS_RETRY_SECONDS"""
+    global _optimizations_retry_at
+    if _optimizations_ready:
+        return
+    
+    now = time.monotonic()
+    if now < _optimizations_retry_at:
+        return
+    _optimizations_retry_at = now + OPTIMIZATIONS_RETRY_SECONDS
+    initialize_optimizations()
+
+@_ttl_cache(STATS_CACHE_TTL)
+def _load_all_tags() -> Tuple[str, ...]:
+    """Collect all unique tags from the database"""
+    ensure_optimizations()
+    with connection_pool.get_reader() as conn:
+        cursor = conn.cursor()
+        
+        # Convert underscores back to spaces for frontend compatibility;
+        # deduplicated and sorted by walking idx_article_tags_display
+        cursor.execute("""
+            SELECT DISTINCT REPLACE(tag, '_', ' ') AS display_tag
+            FROM article_tags
+            ORDER BY display_tag
+        """)
+        
+        return tuple(row[0] for row in cursor)
 
 def get_all_tags() -> List[str]:
-    """Get all unique tags from the database"""
+    """Get all unique tags from the database (cached for STATS_CACHE_TTL seconds)"""
     try:
-        with connection_pool.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get all non-null tags
-            cursor.execute("SELECT DISTINCT tags FROM articles WHERE tags IS NOT NULL AND tags != '' AND tags != '[]'")
-            rows = cursor.fetchall()
-            
-            # Parse JSON tags and collect unique ones
-            all_tags = set()
-            for row in rows:
-                try:
-                    if row[0]:
-                        tags = json.loads(row[0])
-                        if isinstance(tags, list):
-                            # Convert underscores back to spaces for frontend compatibility
-                            formatted_tags = [tag.replace("_", " ") if isinstance(tag, str) else tag for tag in tags]
-                            all_tags.update(formatted_tags)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-            
-            return sorted(list(all_tags))
-            
+        return list(_load_all_tags())
     except Exception as e:
         logger.error(f"Error getting tags: {e}")
         return []
 
-@lru_cache(maxsize=1)
 def get_tags_cached() -> List[str]:
     """Get cached list of all tags"""
     return get_all_tags()
@@ -954,7 +1456,8 @@ def search_articles_optimized(
     limit: int = 20,
     sort_by: str = "desc",
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> Dict:
     """
     Optimized search for articles
@@ -965,25 +1468,23 @@ def search_articles_optimized(
         sort_by=sort_by,
         search_query=query,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        cursor=cursor
     )
 
-def get_all_categories() -> List[Dict]:
-    """Get all available categories with article counts"""
+def get_all_categories(limit: Optional[int] = None) -> List[Dict]:
+    """Get available categories with article counts, optionally only the top `limit`"""
     try:
         category_stats = get_category_stats_cached()
-        categories = []
-        
-        for category, count in category_stats.items():
-            categories.append({
-                "name": category,
-                "article_count": count
-            })
+        categories = (
+            {"name": category, "article_count": count}
+            for category, count in category_stats.items()
+        )
         
         # Sort by article count descending
-        categories.sort(key=lambda x: x["article_count"], reverse=True)
-        
-        return categories
+        if limit is not None:
+            return heapq.nlargest(limit, categories, key=lambda x: x["article_count"])
+        return sorted(categories, key=lambda x: x["article_count"], reverse=True)
         
     except Exception as e:
         logger.error(f"Error getting all categories: {e}")
@@ -994,7 +1495,7 @@ def get_api_statistics() -> Dict:
     try:
         stats = get_cached_stats()
         tags = get_all_tags()
-        categories = get_all_categories()
+        top_categories = get_all_categories(limit=10)
         
         return {
             "status": "healthy",
@@ -1002,9 +1503,9 @@ def get_api_statistics() -> Dict:
             "statistics": {
                 **stats,
                 "total_tags": len(tags),
-                "available_categories": len(categories)
+                "available_categories": len(get_category_stats_cached())
             },
-            "categories": categories[:10],  # Top 10 categories
+            "categories": top_categories,  # Top 10 categories
             "sample_tags": tags[:20] if tags else []  # First 20 tags
         }
         
@@ -1019,7 +1520,5 @@ def get_api_statistics() -> Dict:
 # Initialize on import
 try:
     initialize_optimizations()
-    # Pre-load categories
-    get_cached_category_keywords()
 except Exception as e:
     logger.warning(f"Could not initialize optimizations: {e}")
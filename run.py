@@ -10,13 +10,13 @@ from pathlib import Path
 def run_api():
     """Run the FastAPI server"""
     print("🚀 Starting METABOLIC_BACKEND API...")
-    subprocess.run([
-        sys.executable, "-m", "uvicorn", 
-        "app.main:app", 
-        "--host", "0.0.0.0", 
-        "--port", "8000",
-        "--reload"
-    ])
+    # Serve in this process rather than a child interpreter, so signals
+    # reach uvicorn directly
+    import uvicorn
+    try:
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    except KeyboardInterrupt:
+        pass
 
 def run_scraper():
     """Run the health news scraper"""
@@ -17,7 +17,8 @@ import subprocess
 BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(BASE_DIR))
 
-DB_PATH = BASE_DIR / "data" / "articles.db"
+# Same database the app uses (METABOLIC_DB, then data/ or legacy db/)
+from app.paths import DB_PATH
 
 def check_database_status():
     """Check the current state of the database"""
@@ -31,34 +32,26 @@ def check_database_status():
     with sqlite3.connect(DB_PATH) as conn:
         cursor = conn.cursor()
         
+        # Every count in a single pass over the table
+        cursor.execute("""
+            SELECT
+                COUNT(*),
+                COUNT(CASE WHEN datetime(last_checked) > datetime('now', '-24 hours') THEN 1 END),
+                COUNT(CASE WHEN datetime(last_checked) > datetime('now', '-7 days') THEN 1 END),
+                MAX(last_checked),
+                COUNT(CASE WHEN summary IS NOT NULL AND summary != '' THEN 1 END)
+            FROM articles
+        """)
+        total_articles, recent_24h, recent_7d, last_activity, articles_with_summary = cursor.fetchone()
+        
         # Basic stats
-        cursor.execute("SELECT COUNT(*) FROM articles")
-        total_articles = cursor.fetchone()[0]
         print(f"Total articles: {total_articles}")
         
         # Recent activity
-        cursor.execute("""
-            SELECT COUNT(*) FROM articles 
-            WHERE last_checked IS NOT NULL 
-            AND datetime(last_checked) > datetime('now', '-24 hours')
-        """)
-        recent_24h = cursor.fetchone()[0]
         print(f"Articles checked in last 24 hours: {recent_24h}")
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM articles 
-            WHERE last_checked IS NOT NULL 
-            AND datetime(last_checked) > datetime('now', '-7 days')
-        """)
-        recent_7d = cursor.fetchone()[0]
         print(f"Articles checked in last 7 days: {recent_7d}")
         
         # Most recent activity
-        cursor.execute("""
-            SELECT MAX(last_checked) FROM articles 
-            WHERE last_checked IS NOT NULL
-        """)
-        last_activity = cursor.fetchone()[0]
         if last_activity:
             print(f"Last scraping activity: {last_activity}")
             
@@ -78,8 +71,6 @@ def check_database_status():
             print("❌ No last_checked timestamps found")
         
         # Check summary quality
-        cursor.execute("SELECT COUNT(*) FROM articles WHERE summary IS NOT NULL AND summary != ''")
-        articles_with_summary = cursor.fetchone()[0]
         summary_percentage = (articles_with_summary / total_articles) * 100 if total_articles > 0 else 0
         print(f"Articles with summaries: {articles_with_summary} ({summary_percentage:.1f}%)")
         